@@ -1,13 +1,35 @@
 import os
+import tempfile
+import time
+import uuid
+import hashlib
+import functools
+import threading
 import logging
+import unicodedata
+from datetime import datetime
+from itertools import islice
+from urllib.parse import quote
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, render_template, request, session, redirect, url_for, send_file, jsonify
 from docx_generator import create_report
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+from services.logging_setup import init_queued_logging
+init_queued_logging()
+
 from services.watchdog import watchdog, monitor_function
-from services.flask_middleware import init_watchdog
+from services.flask_middleware import init_watchdog, is_api_request
+from services.compression import init_compression
+from services.json_provider import init_json_provider
+from services.paths import get_cache_dir
 
 from pdf_generator import create_pdf_report
 from services.maps_api import fetch_hotel_data, fetch_venue_data, search_hotels, search_venues
@@ -21,8 +43,10 @@ from services.history import (
     add_report_to_history,
     get_report_by_id,
     get_history_summary,
+    get_history_version,
     delete_report as delete_history_report,
     update_draft,
+    queue_draft_update,
     convert_draft_to_completed
 )
 from services.form_utils import (
@@ -47,16 +71,47 @@ from docx_generator import create_security_questionnaire_docx
 from services.security_brief import get_security_brief_service
 from services.riskbrief import risk_bp
 from services.mediastack import mediastack_bp
+from services.session_store import SQLiteSessionInterface
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SESSION_SECRET', os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production'))
+app.session_interface = SQLiteSessionInterface()
+app.config['SESSION_REFRESH_EACH_REQUEST'] = False
+# Only enable behind a proxy that serves X-Sendfile (e.g. Apache mod_xsendfile,
+# or nginx mapping the spool directory); the bundled Waitress server does not.
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+init_json_provider(app)
 
 init_watchdog(app)
+init_compression(app)
 
 app.register_blueprint(risk_bp, url_prefix='/api')
 app.register_blueprint(mediastack_bp, url_prefix='/api')
 
 
+CLIENT_ERROR_EVENTS = frozenset({
+    'JS_ERROR', 'PROMISE_REJECTION', 'CONSOLE_ERROR', 'NETWORK_ERROR', 'FETCH_ERROR'
+})
+CLIENT_WARNING_EVENTS = frozenset({
+    'CONSOLE_WARN', 'SLOW_PAGE_LOAD', 'SLOW_FETCH', 'SLOW_RESOURCE', 'LONG_TASK'
+})
+CLIENT_ALLOWED_EVENTS = CLIENT_ERROR_EVENTS | CLIENT_WARNING_EVENTS | frozenset({
+    'CLIENT_INIT', 'USER_CLICK', 'FORM_SUBMIT', 'NAVIGATION',
+    'PAGE_LOAD', 'PAGE_UNLOAD', 'CUSTOM_EVENT'
+})
+
+CLIENT_DATA_MAX_KEYS = 1000
+
+_NEWLINE_TABLE = str.maketrans({'\n': ' ', '\r': ''})
+
+
+def _sanitize_client_string(val, max_len=500):
+    """Truncate a client-supplied value and strip line breaks."""
+    if not isinstance(val, str):
+        return str(val)[:max_len] if val else ''
+    return val[:max_len].translate(_NEWLINE_TABLE)
+
+
 @app.route('/api/watchdog/log', methods=['POST'])
 def watchdog_client_log():
     """Receive logs from the frontend watchdog client."""
@@ -67,44 +122,37 @@ def watchdog_client_log():
         if not isinstance(logs, list) or len(logs) > 100:
             return jsonify({'success': False, 'error': 'Invalid payload'})
         
-        ALLOWED_EVENTS = {
-            'CLIENT_INIT', 'JS_ERROR', 'PROMISE_REJECTION', 'CONSOLE_ERROR', 
-            'CONSOLE_WARN', 'USER_CLICK', 'FORM_SUBMIT', 'NAVIGATION',
-            'PAGE_LOAD', 'SLOW_PAGE_LOAD', 'SLOW_FETCH', 'SLOW_RESOURCE',
-            'LONG_TASK', 'NETWORK_ERROR', 'FETCH_ERROR', 'PAGE_UNLOAD', 'CUSTOM_EVENT'
-        }
-        
-        def sanitize_string(val, max_len=500):
-            if not isinstance(val, str):
-                return str(val)[:max_len] if val else ''
-            return val[:max_len].replace('\n', ' ').replace('\r', '')
+        server_timestamp = datetime.now().isoformat()
+        batch = []
         
         for log_entry in logs[:50]:
             if not isinstance(log_entry, dict):
                 continue
                 
-            event_type = sanitize_string(log_entry.get('eventType', 'CLIENT_EVENT'), 50)
-            if event_type not in ALLOWED_EVENTS:
+            event_type = _sanitize_client_string(log_entry.get('eventType', 'CLIENT_EVENT'), 50)
+            if event_type not in CLIENT_ALLOWED_EVENTS:
                 event_type = 'UNKNOWN_CLIENT_EVENT'
             
-            message = sanitize_string(log_entry.get('message', ''), 500)
+            message = _sanitize_client_string(log_entry.get('message', ''), 500)
             
             log_data = {
                 'client_ip': request.remote_addr,
-                'server_timestamp': __import__('datetime').datetime.now().isoformat()
+                'server_timestamp': server_timestamp
             }
             
             client_data = log_entry.get('data', {})
-            if isinstance(client_data, dict):
-                for k, v in list(client_data.items())[:10]:
-                    log_data[f'client_{sanitize_string(k, 30)}'] = sanitize_string(str(v), 200)
+            if isinstance(client_data, dict) and len(client_data) <= CLIENT_DATA_MAX_KEYS:
+                for k, v in islice(client_data.items(), 10):
+                    log_data[f'client_{_sanitize_client_string(k, 30)}'] = _sanitize_client_string(str(v), 200)
             
-            if event_type in ['JS_ERROR', 'PROMISE_REJECTION', 'CONSOLE_ERROR', 'NETWORK_ERROR', 'FETCH_ERROR']:
-                watchdog.log_event(f'CLIENT:{event_type}', message, 'ERROR', log_data)
-            elif event_type in ['CONSOLE_WARN', 'SLOW_PAGE_LOAD', 'SLOW_FETCH', 'SLOW_RESOURCE', 'LONG_TASK']:
-                watchdog.log_event(f'CLIENT:{event_type}', message, 'WARNING', log_data)
+            if event_type in CLIENT_ERROR_EVENTS:
+                batch.append((f'CLIENT:{event_type}', message, 'ERROR', log_data))
+            elif event_type in CLIENT_WARNING_EVENTS:
+                batch.append((f'CLIENT:{event_type}', message, 'WARNING', log_data))
             else:
-                watchdog.log_user_action(event_type, message, extra_data=log_data)
+                batch.append(watchdog.user_action_event(event_type, message, extra_data=log_data))
+        
+        watchdog.log_events_bulk(batch)
         
         return jsonify({'success': True})
     except Exception as e:
@@ -161,7 +209,7 @@ def api_security_intel():
         })
         
     except Exception as e:
-        logger.error(f'Security intel error: {e}', exc_info=True)
+        _log_route_error('Security intel error', e)
         return jsonify({
             'success': False,
             'error': str(e),
@@ -172,11 +220,47 @@ def api_security_intel():
         }), 500
 
 
-@app.route('/search_hotels', methods=['POST'])
+AUTOCOMPLETE_MAX_AGE = 60  # seconds
+
+
+def _autocomplete_params():
+    """Read autocomplete parameters from the query string (GET) or JSON body (POST)."""
+    if request.method == 'GET':
+        return request.args
+    return request.get_json() or {}
+
+
+def _cacheable_json(payload, max_age=AUTOCOMPLETE_MAX_AGE):
+    """
+    JSON response the browser may cache for max_age seconds.
+    
+    A weak ETag over the body lets revalidations of unchanged results be
+    answered with 304 Not Modified.
+    """
+    response = jsonify(payload)
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+def _autocomplete_json(results):
+    """
+    Autocomplete response: cacheable when there are results, no-store when
+    empty. The maps helpers turn upstream failures into [], and a brief
+    outage must not be cached by the browser or a proxy.
+    """
+    if results:
+        return _cacheable_json({'success': True, 'results': results})
+    response = jsonify({'success': True, 'results': []})
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@app.route('/search_hotels', methods=['GET', 'POST'])
 def search_hotels_route():
     """Search for hotels by name/chain, city and country."""
     try:
-        data = request.get_json() or {}
+        data = _autocomplete_params()
         query = data.get('query', '').strip()
         city = data.get('city', '').strip()
         country = data.get('country', '').strip()
@@ -185,17 +269,17 @@ def search_hotels_route():
             return jsonify({'success': True, 'results': []})
         
         results = search_hotels(query, city, country=country, limit=10)
-        return jsonify({'success': True, 'results': results})
+        return _autocomplete_json(results)
     
     except Exception as e:
         return jsonify({'success': False, 'message': str(e), 'results': []})
 
 
-@app.route('/search_venues', methods=['POST'])
+@app.route('/search_venues', methods=['GET', 'POST'])
 def search_venues_route():
     """Search for venues by name and city."""
     try:
-        data = request.get_json() or {}
+        data = _autocomplete_params()
         query = data.get('query', '').strip()
         city = data.get('city', '').strip()
         
@@ -203,15 +287,52 @@ def search_venues_route():
             return jsonify({'success': True, 'results': []})
         
         results = search_venues(query, city, limit=10)
-        return jsonify({'success': True, 'results': results})
+        return _autocomplete_json(results)
     
     except Exception as e:
         return jsonify({'success': False, 'message': str(e), 'results': []})
 
 
+PLACE_PHOTO_MAX_AGE = 86400  # seconds
+
+
+def _place_photo_url(query, place_type):
+    """Build the deterministic placeholder photo URL for a hotel or venue."""
+    seed = hashlib.blake2b(query.encode('utf-8'), digest_size=5).hexdigest()
+    place_type = place_type.lower()
+    
+    if 'hotel' in place_type:
+        return f"https://source.unsplash.com/800x500/?hotel,building,{seed}"
+    if 'arena' in place_type or 'venue' in place_type:
+        return f"https://source.unsplash.com/800x500/?arena,stadium,concert,{seed}"
+    return f"https://source.unsplash.com/800x500/?building,architecture,{seed}"
+
+
+@app.route('/place_photo/<place_type>/<path:query>', methods=['GET'])
+def place_photo_redirect_route(place_type, query):
+    """
+    Redirect to the placeholder photo for a hotel or venue.
+    
+    The URL is a pure function of its inputs, so it can be used directly as
+    an <img> src and cached by the browser.
+    """
+    query = query.strip()
+    if not query:
+        return jsonify({'success': False, 'error': 'No query provided'}), 400
+    
+    response = redirect(_place_photo_url(query, place_type), code=302)
+    response.headers['Cache-Control'] = f'public, max-age={PLACE_PHOTO_MAX_AGE}'
+    return response
+
+
 @app.route('/fetch_place_photo', methods=['POST'])
 def fetch_place_photo_route():
-    """Fetch a photo for a hotel or venue using placeholder images."""
+    """
+    Fetch a photo for a hotel or venue using placeholder images.
+    
+    Deprecated: use GET /place_photo/<type>/<query>, which redirects to the
+    image and saves the JSON round-trip.
+    """
     try:
         data = request.get_json() or {}
         query = data.get('query', '').strip()
@@ -220,15 +341,7 @@ def fetch_place_photo_route():
         if not query:
             return jsonify({'success': False, 'error': 'No query provided'})
         
-        import hashlib
-        seed = hashlib.md5(query.encode()).hexdigest()[:10]
-        
-        if 'hotel' in place_type.lower():
-            photo_url = f"https://source.unsplash.com/800x500/?hotel,building,{seed}"
-        elif 'arena' in place_type.lower() or 'venue' in place_type.lower():
-            photo_url = f"https://source.unsplash.com/800x500/?arena,stadium,concert,{seed}"
-        else:
-            photo_url = f"https://source.unsplash.com/800x500/?building,architecture,{seed}"
+        photo_url = _place_photo_url(query, place_type)
         
         return jsonify({
             'success': True,
@@ -242,79 +355,118 @@ def fetch_place_photo_route():
         return jsonify({'success': False, 'error': str(e)})
 
 
-@app.route('/search_cities', methods=['POST'])
+_OSM_CITY_VALUES = frozenset({'city', 'town', 'village', 'municipality', 'suburb', 'district'})
+_OSM_CITY_TYPES = frozenset({'city', 'town', 'village', 'locality'})
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_city_key(s):
+    """Lower-case, accent-free key used to de-duplicate city suggestions."""
+    return unicodedata.normalize('NFD', s.lower()).encode('ascii', 'ignore').decode('ascii')
+
+
+PHOTON_CACHE_TTL = 24 * 3600  # seconds
+PHOTON_CACHE_MAX_ENTRIES = 2048
+
+_photon_cache = {}
+
+# Shared keep-alive pool so autocomplete keystrokes reuse the TLS connection.
+_photon_session = requests.Session()
+_photon_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, allowed_methods=['GET'])
+))
+PHOTON_TIMEOUT = (1.0, 4.0)  # (connect, read) seconds
+
+
+def _iter_cities(features):
+    """Yield (properties, coordinates) for named city-like Photon features."""
+    for feature in features:
+        props = feature.get('properties') or {}
+        if props.get('osm_value') not in _OSM_CITY_VALUES and props.get('type') not in _OSM_CITY_TYPES:
+            continue
+        if not props.get('name'):
+            continue
+        yield props, (feature.get('geometry') or {}).get('coordinates') or []
+
+
+def _photon_lookup(query, country):
+    """
+    Query Photon for cities matching query/country.
+    
+    Results are cached in-process for PHOTON_CACHE_TTL, keyed on the
+    case-insensitive query so repeated autocomplete prefixes skip the
+    network round-trip. Returns None if the upstream call failed.
+    """
+    cache_key = f"{query.lower().strip()}|{country.lower().strip()}"
+    cached = _photon_cache.get(cache_key)
+    if cached and time.time() - cached[0] < PHOTON_CACHE_TTL:
+        return cached[1]
+    
+    search_query = query
+    if country:
+        search_query = f"{query}, {country}"
+    
+    url = f"https://photon.komoot.io/api/?q={quote(search_query)}&limit=15&lang=fr"
+    
+    response = _photon_session.get(url, timeout=PHOTON_TIMEOUT)
+    if response.status_code != 200:
+        return None
+    
+    data = response.json()
+    results = []
+    seen = set()
+    
+    for props, coords in _iter_cities(data.get('features', ())):
+        city_name = props['name']
+        city_country = props.get('country', '')
+        state = props.get('state', '')
+        
+        display = city_name
+        if state and state != city_name:
+            display = f"{city_name}, {state}"
+        if city_country:
+            display = f"{display}, {city_country}"
+        
+        key = _normalize_city_key(display)
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        results.append({
+            'name': city_name,
+            'display': display,
+            'country': city_country,
+            'state': state,
+            'lat': coords[1] if len(coords) > 1 else None,
+            'lon': coords[0] if len(coords) > 0 else None
+        })
+        
+        if len(results) >= 8:
+            break
+    
+    if len(_photon_cache) >= PHOTON_CACHE_MAX_ENTRIES:
+        _photon_cache.clear()
+    _photon_cache[cache_key] = (time.time(), results)
+    return results
+
+
+@app.route('/search_cities', methods=['GET', 'POST'])
 def search_cities_route():
     """Search for cities by name using Photon geocoding API."""
     try:
-        data = request.get_json() or {}
+        data = _autocomplete_params()
         query = data.get('query', '').strip()
         country = data.get('country', '').strip()
         
         if not query or len(query) < 2:
             return jsonify({'success': True, 'results': []})
         
-        import requests
-        import unicodedata
-        from urllib.parse import quote
-        
-        def normalize_str(s):
-            return unicodedata.normalize('NFD', s.lower()).encode('ascii', 'ignore').decode('ascii')
-        
-        search_query = query
-        if country:
-            search_query = f"{query}, {country}"
-        
-        url = f"https://photon.komoot.io/api/?q={quote(search_query)}&limit=15&lang=fr"
-        
         try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                results = []
-                seen = set()
-                
-                for feature in data.get('features', []):
-                    props = feature.get('properties', {})
-                    osm_type = props.get('osm_value', '')
-                    
-                    if osm_type not in ['city', 'town', 'village', 'municipality', 'suburb', 'district']:
-                        place_type = props.get('type', '')
-                        if place_type not in ['city', 'town', 'village', 'locality']:
-                            continue
-                    
-                    city_name = props.get('name', '')
-                    if not city_name:
-                        continue
-                    
-                    city_country = props.get('country', '')
-                    state = props.get('state', '')
-                    
-                    display = city_name
-                    if state and state != city_name:
-                        display = f"{city_name}, {state}"
-                    if city_country:
-                        display = f"{display}, {city_country}"
-                    
-                    key = normalize_str(display)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    
-                    coords = feature.get('geometry', {}).get('coordinates', [])
-                    
-                    results.append({
-                        'name': city_name,
-                        'display': display,
-                        'country': city_country,
-                        'state': state,
-                        'lat': coords[1] if len(coords) > 1 else None,
-                        'lon': coords[0] if len(coords) > 0 else None
-                    })
-                    
-                    if len(results) >= 8:
-                        break
-                
-                return jsonify({'success': True, 'results': results})
+            results = _photon_lookup(query, country)
+            if results is not None:
+                return _cacheable_json({'success': True, 'results': results})
         
         except Exception as e:
             logger.warning(f"City search error: {e}")
@@ -325,6 +477,161 @@ def search_cities_route():
         return jsonify({'success': False, 'message': str(e), 'results': []})
 
 
+AI_RESULT_CACHE_SIZE = 512
+AI_RESULT_CACHE_TTL = 3600  # seconds
+# Part of every cache key: bump when the prompts or the model change.
+AI_RESULT_CACHE_VERSION = 'gpt-4o-mini:1'
+
+_ai_result_cache = OrderedDict()
+_ai_result_cache_lock = threading.Lock()
+
+
+def _ai_cache_key_part(value):
+    """Normalise an AI helper argument into a hashable, case-insensitive key."""
+    if isinstance(value, str):
+        return value.lower().strip()
+    if isinstance(value, dict):
+        return tuple(sorted((k, _ai_cache_key_part(v)) for k, v in value.items()))
+    return value
+
+
+def _memoize_ai_result(fn):
+    """
+    LRU-memoise an LLM-backed helper on its normalised arguments.
+    
+    Only successful results are kept, for AI_RESULT_CACHE_TTL seconds, so
+    a retry after a failure still reaches the model.
+    """
+    def make_key(args):
+        return (AI_RESULT_CACHE_VERSION, fn.__name__, tuple(_ai_cache_key_part(a) for a in args))
+    
+    def peek(*args):
+        """Return the cached result for args, or None."""
+        key = make_key(args)
+        with _ai_result_cache_lock:
+            cached = _ai_result_cache.get(key)
+            if cached and time.time() - cached[0] < AI_RESULT_CACHE_TTL:
+                _ai_result_cache.move_to_end(key)
+                return cached[1]
+        return None
+    
+    @functools.wraps(fn)
+    def wrapper(*args):
+        cached = peek(*args)
+        if cached is not None:
+            return cached
+        
+        key = make_key(args)
+        now = time.time()
+        result = fn(*args)
+        
+        if isinstance(result, dict) and result.get('success'):
+            with _ai_result_cache_lock:
+                _ai_result_cache[key] = (now, result)
+                _ai_result_cache.move_to_end(key)
+                while len(_ai_result_cache) > AI_RESULT_CACHE_SIZE:
+                    _ai_result_cache.popitem(last=False)
+        return result
+    
+    wrapper.peek = peek
+    return wrapper
+
+
+_ai_assist_hotel_cached = _memoize_ai_result(ai_assist_hotel)
+_ai_assist_venue_cached = _memoize_ai_result(ai_assist_venue)
+_security_brief_hotel_cached = _memoize_ai_result(generate_security_brief_hotel)
+_security_brief_venue_cached = _memoize_ai_result(generate_security_brief_venue)
+
+
+AI_POOL_MAX_WORKERS = 8
+AI_JOB_QUEUE_LIMIT = 32
+AI_JOB_TTL = 600  # seconds a finished job is kept for polling
+
+AI_POOL = ThreadPoolExecutor(max_workers=AI_POOL_MAX_WORKERS, thread_name_prefix='ai-job')
+_ai_jobs = {}
+_ai_jobs_lock = threading.Lock()
+
+
+@app.context_processor
+def _ai_job_settings():
+    """Expose AI_JOB_TTL so the polling pages give up when the server would."""
+    return {'ai_job_ttl': AI_JOB_TTL}
+
+
+def _run_ai_job(fn, args, error_prefix, fallback):
+    """Run an AI helper, turning exceptions into the route's error payload."""
+    try:
+        return fn(*args)
+    except Exception as e:
+        logger.error(f'{error_prefix}: {str(e)}')
+        return {'success': False, 'message': f'{error_prefix}: {str(e)}', **fallback}
+
+
+def _submit_ai_job(fn, args, error_prefix, fallback):
+    """
+    Queue a slow LLM-backed call on AI_POOL so the request thread is freed.
+    
+    Returns the job id, or None when AI_JOB_QUEUE_LIMIT jobs are already
+    pending. Finished jobs are dropped AI_JOB_TTL seconds after submission.
+    """
+    now = time.time()
+    with _ai_jobs_lock:
+        for job_id, (submitted_at, future) in list(_ai_jobs.items()):
+            if future.done() and now - submitted_at > AI_JOB_TTL:
+                del _ai_jobs[job_id]
+        
+        pending = sum(1 for _, future in _ai_jobs.values() if not future.done())
+        if pending >= AI_JOB_QUEUE_LIMIT:
+            return None
+        
+        job_id = uuid.uuid4().hex
+        _ai_jobs[job_id] = (now, AI_POOL.submit(_run_ai_job, fn, args, error_prefix, fallback))
+    return job_id
+
+
+def _dispatch_ai_job(fn, args, error_prefix, fallback):
+    """
+    Answer an AI route: the memoised result if there is one, otherwise a
+    202 with the queued job id, or a 503 when the pool is saturated.
+    """
+    peek = getattr(fn, 'peek', None)
+    cached = peek(*args) if peek else None
+    if cached is not None:
+        return jsonify(cached)
+    
+    job_id = _submit_ai_job(fn, args, error_prefix, fallback)
+    if job_id is None:
+        return jsonify({
+            'success': False,
+            'message': 'The server is busy, please try again in a moment.',
+            **fallback
+        }), 503
+    return jsonify({'success': True, 'status': 'pending', 'job_id': job_id}), 202
+
+
+@app.route('/ai_job/<job_id>', methods=['GET'])
+def ai_job_status_route(job_id):
+    """Poll a job queued by the AI assist / security brief routes."""
+    with _ai_jobs_lock:
+        entry = _ai_jobs.get(job_id)
+    
+    if entry is None:
+        return jsonify({
+            'success': False,
+            'status': 'unknown',
+            'message': 'Unknown or expired job.'
+        }), 404
+    
+    future = entry[1]
+    if not future.done():
+        return jsonify({'success': True, 'status': 'pending', 'job_id': job_id})
+    
+    with _ai_jobs_lock:
+        _ai_jobs.pop(job_id, None)
+    
+    return jsonify({**future.result(), 'status': 'done'})
+
+
 @app.route('/ai_assist_hotel', methods=['POST'])
 def ai_assist_hotel_route():
     empty_data = get_empty_hotel_ai_data()
@@ -342,8 +649,8 @@ def ai_assist_hotel_route():
             })
         
         venue_address = session.get('form_data', {}).get('venue_address', '')
-        result = ai_assist_hotel(hotel_name, hotel_address, venue_address)
-        return jsonify(result)
+        return _dispatch_ai_job(_ai_assist_hotel_cached, (hotel_name, hotel_address, venue_address),
+                                'AI assistant error', {'data': empty_data})
     
     except Exception as e:
         return jsonify({
@@ -369,8 +676,8 @@ def ai_assist_venue_route():
                 'data': empty_data
             })
         
-        result = ai_assist_venue(venue_name, venue_address)
-        return jsonify(result)
+        return _dispatch_ai_job(_ai_assist_venue_cached, (venue_name, venue_address),
+                                'AI assistant error', {'data': empty_data})
     
     except Exception as e:
         return jsonify({
@@ -407,8 +714,8 @@ def security_brief_hotel_route():
                 'brief': ''
             })
         
-        result = generate_security_brief_hotel(brief_data)
-        return jsonify(result)
+        return _dispatch_ai_job(_security_brief_hotel_cached, (brief_data,),
+                                'Security brief error', {'brief': ''})
     
     except Exception as e:
         return jsonify({
@@ -446,8 +753,8 @@ def security_brief_venue_route():
                 'brief': ''
             })
         
-        result = generate_security_brief_venue(brief_data)
-        return jsonify(result)
+        return _dispatch_ai_job(_security_brief_venue_cached, (brief_data,),
+                                'Security brief error', {'brief': ''})
     
     except Exception as e:
         return jsonify({
@@ -582,20 +889,41 @@ def save_form_ajax():
         if 'form_data' not in session:
             session['form_data'] = get_default_form_data()
         
-        form_data = session['form_data'].copy()
+        form_data = session['form_data']
+        changed = False
         
         for key, value in data.items():
-            if key in form_data:
+            if key in form_data and form_data[key] != value:
                 form_data[key] = value
+                changed = True
         
-        session['form_data'] = form_data
-        session.modified = True
+        if changed:
+            session.modified = True
         
         return jsonify({'success': True, 'message': 'Form data saved'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 
+# Failures that are part of normal operation (bad input, upstream outages):
+# logged without a traceback to keep the error path cheap.
+EXPECTED_ERRORS = (ValueError, KeyError, requests.RequestException)
+
+
+def _log_route_error(message, e):
+    """Log a route failure, with a traceback only when it is unexpected."""
+    logger.error(f'{message}: {e}', exc_info=not isinstance(e, EXPECTED_ERRORS))
+
+
+def _form_flag(name):
+    """Read a boolean form field (hidden input 'true'/'false' or a checkbox)."""
+    return request.form.get(name) in ('true', 'on', '1')
+
+
+# Fields the main form is allowed to write into session['form_data'].
+VALID_FORM_KEYS = frozenset(get_default_form_data())
+
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     if request.method == 'GET':
@@ -606,7 +934,6 @@ def index():
         elif 'form_data' not in session:
             session['form_data'] = get_default_form_data()
             session.pop('current_draft_id', None)
-        session.modified = True
     
     if 'form_data' not in session:
         session['form_data'] = get_default_form_data()
@@ -614,34 +941,35 @@ def index():
     if request.method == 'POST':
         action = request.form.get('action', '')
         
-        form_data = session['form_data'].copy()
-        for key in form_data.keys():
-            if key in request.form:
-                form_data[key] = request.form.get(key, '')
-        
-        form_data['has_two_hotels'] = request.form.get('has_two_hotels') == 'true'
-        build_name_address_fields(form_data)
-        
-        session['form_data'] = form_data
-        session.modified = True
+        form_data = session['form_data']
+        changed = False
+        for key in request.form.keys() & VALID_FORM_KEYS:
+            value = request.form.get(key, '')
+            if form_data.get(key) != value:
+                form_data[key] = value
+                changed = True
         
+        has_two_hotels = _form_flag('has_two_hotels')
         if action == 'add_hotel':
-            form_data['has_two_hotels'] = True
-            session['form_data'] = form_data
-            session.modified = True
-            return redirect(url_for('index'))
-        
+            has_two_hotels = True
         elif action == 'remove_hotel':
-            form_data['has_two_hotels'] = False
-            for key in list(form_data.keys()):
-                if key.startswith('hotel2_'):
+            has_two_hotels = False
+        if form_data.get('has_two_hotels') != has_two_hotels:
+            form_data['has_two_hotels'] = has_two_hotels
+            changed = True
+        
+        if action == 'remove_hotel':
+            for key in form_data.keys():
+                if key.startswith('hotel2_') and form_data[key] != '':
                     form_data[key] = ''
-            session['form_data'] = form_data
+                    changed = True
+        
+        if changed:
+            build_name_address_fields(form_data)
             session.modified = True
-            return redirect(url_for('index'))
         
-        session['form_data'] = form_data
-        session.modified = True
+        if action in ('add_hotel', 'remove_hotel'):
+            return redirect(url_for('index'))
     
     has_api_key = bool(os.environ.get('GOOGLE_MAPS_API_KEY'))
     ai_available = is_ai_available()
@@ -656,6 +984,88 @@ def index():
                          current_draft_id=current_draft_id)
 
 
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+
+SPOOL_PREFIX = 'rrg_report_'
+SPOOL_MAX_AGE = 3600  # seconds
+# Dedicated directory so sweeping never walks the whole system temp dir
+# (%TEMP% on Windows routinely holds thousands of entries).
+SPOOL_DIR = get_cache_dir() / 'spool'
+_spool_lock = threading.Lock()
+_spool_swept_at = None
+
+
+def _remove_spooled(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _sweep_spool():
+    """
+    Remove spooled documents that could not be deleted right after sending.
+    
+    Runs at most once per SPOOL_MAX_AGE (first on the first download, which
+    also clears files left by a previous run).
+    """
+    global _spool_swept_at
+    now = time.time()
+    with _spool_lock:
+        if _spool_swept_at is not None and now - _spool_swept_at < SPOOL_MAX_AGE:
+            return
+        _spool_swept_at = now
+    
+    cutoff = now - SPOOL_MAX_AGE
+    try:
+        entries = list(os.scandir(SPOOL_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        # Files can vanish mid-sweep (_send_spooled_file unlinks them).
+        try:
+            if entry.name.startswith(SPOOL_PREFIX) and entry.stat().st_mtime < cutoff:
+                _remove_spooled(entry.path)
+        except OSError:
+            continue
+
+
+def _spool_path(suffix):
+    """Reserve a temporary file for a generated document and return its path."""
+    SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    _sweep_spool()
+    with tempfile.NamedTemporaryFile(prefix=SPOOL_PREFIX, suffix=suffix,
+                                     dir=SPOOL_DIR, delete=False) as tmp:
+        return tmp.name
+
+
+def _send_spooled_file(path, filename, mimetype):
+    """
+    Send a generated document from disk as an attachment.
+    
+    Serving a real file lets the WSGI server use its file wrapper (sendfile)
+    and lets Werkzeug answer Range / conditional requests with an exact
+    Content-Length. Behind a proxy that honours X-Sendfile (USE_X_SENDFILE=1),
+    the body is not sent by the app at all.
+    """
+    try:
+        return send_file(
+            path,
+            as_attachment=True,
+            download_name=filename,
+            mimetype=mimetype,
+            conditional=True
+        )
+    finally:
+        # The response already holds an open handle, so on POSIX the name can
+        # go now. Windows refuses to unlink open files; _sweep_spool gets those.
+        # With X-Sendfile the proxy reads the file after we return, so it is
+        # left for _sweep_spool as well.
+        if not app.config['USE_X_SENDFILE']:
+            _remove_spooled(path)
+
+
 @app.route('/generate', methods=['POST'])
 def generate_report():
     """Generate and download a Word document report."""
@@ -668,33 +1078,28 @@ def generate_report():
             if key in form_data:
                 form_data[key] = request.form.get(key, '')
         
-        form_data['has_two_hotels'] = 'has_two_hotels' in request.form or request.form.get('has_two_hotels') == 'true'
+        form_data['has_two_hotels'] = _form_flag('has_two_hotels')
         build_name_address_fields(form_data)
         
         session['form_data'] = form_data
-        session.modified = True
         
         security_data = build_security_data(form_data)
-        doc_io = create_report(form_data, security_data)
+        doc_path = _spool_path('.docx')
+        try:
+            create_report(form_data, doc_path)
+        except Exception:
+            _remove_spooled(doc_path)
+            raise
         filename = generate_safe_filename(form_data.get('venue_name', 'Report'), 'docx')
         
-        current_draft_id = session.get('current_draft_id')
+        current_draft_id = session.pop('current_draft_id', None)
         if current_draft_id:
             update_draft(current_draft_id, form_data, security_data)
             convert_draft_to_completed(current_draft_id, filename)
-            session.pop('current_draft_id', None)
-        
-        session['form_data'] = form_data
-        session.modified = True
         
-        return send_file(
-            doc_io,
-            mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_spooled_file(doc_path, filename, DOCX_MIMETYPE)
     except Exception as e:
-        logger.error(f'Error generating Word document: {str(e)}', exc_info=True)
+        _log_route_error('Error generating Word document', e)
         return render_template('index.html',
                              form_data=session.get('form_data', get_default_form_data()),
                              has_api_key=bool(os.environ.get('GOOGLE_MAPS_API_KEY')),
@@ -716,33 +1121,31 @@ def generate_pdf_report():
             if key in form_data:
                 form_data[key] = request.form.get(key, '')
         
-        form_data['has_two_hotels'] = 'has_two_hotels' in request.form or request.form.get('has_two_hotels') == 'true'
+        form_data['has_two_hotels'] = _form_flag('has_two_hotels')
         build_name_address_fields(form_data)
         
+        session['form_data'] = form_data
+        
         security_data = build_security_data(form_data)
         filename = generate_safe_filename(form_data.get('venue_name', 'Report'), 'pdf')
         
-        current_draft_id = session.get('current_draft_id')
+        current_draft_id = session.pop('current_draft_id', None)
         if current_draft_id:
             update_draft(current_draft_id, form_data, security_data)
             convert_draft_to_completed(current_draft_id, filename)
-            session.pop('current_draft_id', None)
         else:
             add_report_to_history(form_data, security_data, filename)
         
-        pdf_io = create_pdf_report(form_data, security_data)
-        
-        session['form_data'] = form_data
-        session.modified = True
+        pdf_path = _spool_path('.pdf')
+        try:
+            create_pdf_report(form_data, pdf_path)
+        except Exception:
+            _remove_spooled(pdf_path)
+            raise
         
-        return send_file(
-            pdf_io,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_spooled_file(pdf_path, filename, 'application/pdf')
     except Exception as e:
-        logger.error(f'Error generating PDF report: {str(e)}', exc_info=True)
+        _log_route_error('Error generating PDF report', e)
         return render_template('index.html',
                              form_data=session.get('form_data', get_default_form_data()),
                              has_api_key=bool(os.environ.get('GOOGLE_MAPS_API_KEY')),
@@ -756,7 +1159,6 @@ def generate_pdf_report():
 def new_report():
     session['form_data'] = get_default_form_data()
     session.pop('current_draft_id', None)
-    session.modified = True
     return redirect(url_for('index'))
 
 
@@ -770,24 +1172,21 @@ def save_draft():
         
         logger.info(f"[SAVE_DRAFT] Received form keys: {list(request.form.keys())}")
         
-        for key in request.form.keys():
-            form_data[key] = request.form.get(key, '')
+        form_data.update(request.form.to_dict(flat=True))
         
         logger.info(f"[SAVE_DRAFT] event_start_date={form_data.get('event_start_date')}, event_country={form_data.get('event_country')}, hotel1_name={form_data.get('hotel1_name')}")
         
-        form_data['has_two_hotels'] = 'has_two_hotels' in request.form or request.form.get('has_two_hotels') == 'true'
+        form_data['has_two_hotels'] = _form_flag('has_two_hotels')
         build_name_address_fields(form_data)
         
         session['form_data'] = form_data
-        session.modified = True
         
         security_data = build_security_data(form_data)
         
         current_draft_id = session.get('current_draft_id')
         
         if current_draft_id:
-            success = update_draft(current_draft_id, form_data, security_data)
-            if success:
+            if queue_draft_update(current_draft_id, form_data, security_data):
                 return jsonify({
                     'success': True, 
                     'message': 'Brouillon mis à jour',
@@ -798,7 +1197,6 @@ def save_draft():
         
         if draft_id:
             session['current_draft_id'] = draft_id
-            session.modified = True
             return jsonify({
                 'success': True, 
                 'message': 'Brouillon sauvegardé',
@@ -808,7 +1206,7 @@ def save_draft():
         return jsonify({'success': False, 'message': 'Erreur lors de la sauvegarde'})
     
     except Exception as e:
-        logger.error(f'Error saving draft: {str(e)}', exc_info=True)
+        _log_route_error('Error saving draft', e)
         return jsonify({'success': False, 'message': f'Erreur: {str(e)}'})
 
 
@@ -819,7 +1217,7 @@ def history_page():
         reports = get_history_summary()
         return render_template('history.html', reports=reports)
     except Exception as e:
-        logger.error(f'Error loading history: {str(e)}', exc_info=True)
+        _log_route_error('Error loading history', e)
         return render_template('history.html', reports=[], error_message=f'Error loading history: {str(e)}'), 500
 
 
@@ -836,12 +1234,11 @@ def load_from_history(report_id):
                 session['current_draft_id'] = report_id
             else:
                 session.pop('current_draft_id', None)
-            session.modified = True
             return redirect(url_for('index'))
         
         return redirect(url_for('history_page'))
     except Exception as e:
-        logger.error(f'Error loading report: {str(e)}', exc_info=True)
+        _log_route_error('Error loading report', e)
         try:
             reports = get_history_summary()
         except Exception:
@@ -856,7 +1253,7 @@ def delete_from_history(report_id):
         delete_history_report(report_id)
         return redirect(url_for('history_page'))
     except Exception as e:
-        logger.error(f'Error deleting report: {str(e)}', exc_info=True)
+        _log_route_error('Error deleting report', e)
         try:
             reports = get_history_summary()
         except Exception:
@@ -868,10 +1265,16 @@ def delete_from_history(report_id):
 def get_history_api():
     """API endpoint to get history summary."""
     try:
-        reports = get_history_summary()
-        return jsonify({'success': True, 'reports': reports})
+        version = get_history_version()
+        if request.if_none_match.contains_weak(version):
+            response = app.response_class(status=304)
+        else:
+            response = jsonify({'success': True, 'reports': get_history_summary()})
+        response.set_etag(version)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
-        logger.error(f'Error fetching history API: {str(e)}', exc_info=True)
+        _log_route_error('Error fetching history API', e)
         return jsonify({'success': False, 'message': f'Error fetching history: {str(e)}', 'reports': []}), 500
 
 
@@ -881,9 +1284,31 @@ def security_brief_page():
     return render_template('security_brief.html')
 
 
+def _generate_security_brief_job(city, country, address, start_date, end_date):
+    service = get_security_brief_service()
+    return service.generate_brief(city, country, address, start_date=start_date, end_date=end_date)
+
+
+def _peek_security_brief(city, country, address, start_date, end_date):
+    """Return the cached brief without generating one, or None."""
+    cached = get_security_brief_service().cache.get(city, country, address, start_date, end_date)
+    if cached:
+        cached['from_cache'] = True
+    return cached
+
+
+_generate_security_brief_job.peek = _peek_security_brief
+
+
 @app.route('/api/security-brief', methods=['POST'])
 def generate_security_brief():
-    """Generate a security brief for a city."""
+    """
+    Generate a security brief for a city.
+    
+    Cached briefs are returned directly; otherwise the brief is built on
+    AI_POOL and the response is a 202 with a job id to poll at
+    /api/security-brief/<job_id>.
+    """
     try:
         data = request.get_json() or {}
         city = data.get('city', '').strip()
@@ -898,19 +1323,27 @@ def generate_security_brief():
                 'error': 'City and country are required'
             }), 400
         
-        service = get_security_brief_service()
-        result = service.generate_brief(city, country, address, start_date=start_date, end_date=end_date)
-        
-        return jsonify(result)
+        return _dispatch_ai_job(
+            _generate_security_brief_job,
+            (city, country, address, start_date, end_date),
+            'Failed to generate brief',
+            {}
+        )
         
     except Exception as e:
-        logger.error(f'Error generating security brief: {str(e)}', exc_info=True)
+        _log_route_error('Error generating security brief', e)
         return jsonify({
             'success': False,
             'error': f'Failed to generate brief: {str(e)}'
         }), 500
 
 
+@app.route('/api/security-brief/<job_id>', methods=['GET'])
+def security_brief_job_status(job_id):
+    """Poll a security brief queued by POST /api/security-brief."""
+    return ai_job_status_route(job_id)
+
+
 @app.route('/api/security-brief/refresh', methods=['POST'])
 def refresh_security_brief():
     """Force refresh a security brief (bypass cache)."""
@@ -929,13 +1362,13 @@ def refresh_security_brief():
             }), 400
         
         service = get_security_brief_service()
-        service.invalidate_cache(city, country, address)
-        result = service.generate_brief(city, country, address, use_cache=False, start_date=start_date, end_date=end_date)
+        service.invalidate_cache(city, country, address, start_date=start_date, end_date=end_date)
+        result = service.generate_brief(city, country, address, start_date=start_date, end_date=end_date)
         
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f'Error refreshing security brief: {str(e)}', exc_info=True)
+        _log_route_error('Error refreshing security brief', e)
         return jsonify({
             'success': False,
             'error': f'Failed to refresh brief: {str(e)}'
@@ -955,7 +1388,7 @@ def healthcheck():
 @app.errorhandler(404)
 def not_found_error(error):
     """Handle 404 errors."""
-    if request.is_json or request.path.startswith('/api/'):
+    if is_api_request():
         return jsonify({'success': False, 'error': 'Resource not found'}), 404
     return render_template('error.html', 
                           error_code=404, 
@@ -966,7 +1399,7 @@ def not_found_error(error):
 def internal_error(error):
     """Handle 500 errors."""
     logger.error(f'Internal server error: {error}', exc_info=True)
-    if request.is_json or request.path.startswith('/api/'):
+    if is_api_request():
         return jsonify({'success': False, 'error': 'Internal server error'}), 500
     return render_template('error.html',
                           error_code=500,
@@ -976,4 +1409,4 @@ def internal_error(error):
 if __name__ == '__main__':
     host = os.environ.get('HOST', '0.0.0.0')
     port = int(os.environ.get('PORT', 5000))
-    app.run(host=host, port=port, debug=True)
+    app.run(host=host, port=port, debug=False, threaded=True)
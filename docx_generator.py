@@ -1,11 +1,14 @@
 # docx_generator.py
 from __future__ import annotations
 
+import io
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import IO, Any, Dict, Optional, Union
 
 try:
     from docx import Document  # package "python-docx"
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
 except Exception as e:
     # Message clair si python-docx n'est pas embarqué
     raise RuntimeError(
@@ -14,23 +17,61 @@ except Exception as e:
     ) from e
 
 
-def generate_docx(data: Any, output_path: str) -> str:
+def _template_bytes() -> bytes:
+    """Sérialise une fois le modèle par défaut de python-docx."""
+    buffer = io.BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+# Document() relit et reparse default.docx à chaque appel : on garde le modèle
+# en mémoire et chaque génération l'ouvre depuis son propre flux.
+_TEMPLATE_BYTES = _template_bytes()
+
+
+def _paragraph_element(text: str, style_id: Optional[str] = None):
+    """Construit directement un <w:p> (style + run), sans passer par l'API haut niveau."""
+    p = OxmlElement("w:p")
+    if style_id:
+        p_pr = OxmlElement("w:pPr")
+        p_style = OxmlElement("w:pStyle")
+        p_style.set(qn("w:val"), style_id)
+        p_pr.append(p_style)
+        p.append(p_pr)
+    if text:
+        run = OxmlElement("w:r")
+        run.text = text  # gère \n et \t comme add_paragraph
+        p.append(run)
+    return p
+
+
+def generate_docx(data: Any, output_path: Union[str, IO[bytes]]) -> Union[str, IO[bytes]]:
     """
     Génère un DOCX simple à partir de data (dict/str/whatever).
-    Retourne le chemin du fichier généré.
+    output_path peut être un chemin ou un flux binaire ouvert en écriture.
+    Retourne output_path.
     """
-    doc = Document()
-    doc.add_heading("Response Report Generator", level=1)
-    doc.add_paragraph(f"Generated: {datetime.now().isoformat(timespec='seconds')}")
+    doc = Document(io.BytesIO(_TEMPLATE_BYTES))
+    add_heading = doc.add_heading
+    add_paragraph = doc.add_paragraph
+
+    add_heading("Response Report Generator", level=1)
+    add_paragraph(f"Generated: {datetime.now().isoformat(timespec='seconds')}")
 
-    doc.add_paragraph("")  # spacer
+    add_paragraph("")  # spacer
 
     if isinstance(data, dict):
+        # Style résolu une seule fois, puis tous les paragraphes sont insérés
+        # d'un bloc avant le sectPr final du body.
+        heading_id = doc.styles["Heading 2"].style_id
+        body = doc.element.body
+        anchor = body.sectPr
+        insert = anchor.addprevious if anchor is not None else body.append
         for k, v in data.items():
-            doc.add_heading(str(k), level=2)
-            doc.add_paragraph(str(v))
+            insert(_paragraph_element(str(k), heading_id))
+            insert(_paragraph_element(str(v)))
     else:
-        doc.add_paragraph(str(data))
+        add_paragraph(str(data))
 
     doc.save(output_path)
     return output_path
@@ -1,43 +1,53 @@
 # pdf_generator.py
 from __future__ import annotations
-from typing import Any
+from typing import IO, Any, Union
 import os
 
-def create_pdf_report(data: Any, output_path: str) -> str:
+# Import au chargement du module (préchargé au démarrage via app.py) pour ne
+# pas payer l'import de reportlab sur le premier PDF. Un échec est mémorisé
+# au lieu de faire crasher l'app : l'erreur est levée à la génération.
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Preformatted
+    _REPORTLAB_IMPORT_ERROR = None
+except Exception as _e:  # pragma: no cover - dépend du bundle
+    _REPORTLAB_IMPORT_ERROR = _e
+
+def create_pdf_report(data: Any, output_path: Union[str, IO[bytes]]) -> Union[str, IO[bytes]]:
     """
     Génère un PDF minimaliste.
+    output_path peut être un chemin ou un flux binaire ouvert en écriture.
     Ne doit PAS faire crasher l'app au moment de l'import.
     """
-    # Import tardif pour éviter un crash au démarrage si reportlab n'est pas embarqué
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.pdfgen import canvas
-    except Exception as e:
+    if _REPORTLAB_IMPORT_ERROR is not None:
         raise RuntimeError(
             "Le module 'reportlab' est requis pour générer des PDFs. "
             "Ajoute 'reportlab' à requirements.txt puis rebuild."
-        ) from e
-
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-    c = canvas.Canvas(output_path, pagesize=A4)
-    width, height = A4
-
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(50, height - 60, "Response Report Generator")
+        ) from _REPORTLAB_IMPORT_ERROR
 
-    c.setFont("Helvetica", 10)
-    y = height - 90
-    text = str(data)
+    if isinstance(output_path, str):
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-    # découpe simple
-    for line in text.splitlines() or [text]:
-        if y < 50:
-            c.showPage()
-            y = height - 60
-            c.setFont("Helvetica", 10)
-        c.drawString(50, y, line[:120])
-        y -= 14
+    title_style = ParagraphStyle("RRGTitle", fontName="Helvetica-Bold", fontSize=16, leading=20, spaceAfter=10)
+    body_style = ParagraphStyle("RRGBody", fontName="Helvetica", fontSize=10, leading=14)
 
-    c.save()
+    # Platypus gère la mise en page et la pagination en un seul passage,
+    # au lieu d'un drawString + showPage manuel par ligne. Preformatted dessine
+    # chaque fragment de page avec un seul objet texte (un bloc BT/ET, une
+    # fois setFont), pas un opérateur par ligne.
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=A4,
+        leftMargin=50,
+        rightMargin=50,
+        topMargin=44,
+        bottomMargin=50,
+        title="Response Report Generator",
+    )
+    story = [
+        Paragraph("Response Report Generator", title_style),
+        Preformatted(str(data), body_style, maxLineLength=120),
+    ]
+    doc.build(story)
     return output_path
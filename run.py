@@ -7,11 +7,17 @@ Starts the Flask web app and opens Safari (macOS) or the default browser.
 
 import os
 import sys
-import time
 import socket
-import threading
 import webbrowser
 import subprocess
+from typing import Callable, Optional
+
+
+# Resolved once at import; neither location changes for the life of the process.
+_RUNTIME_ROOT = (os.path.dirname(sys.executable) if getattr(sys, "frozen", False)
+                 else os.path.dirname(os.path.abspath(__file__)))
+_BUNDLE_DIR = (sys._MEIPASS if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS")
+               else _RUNTIME_ROOT)
 
 
 def get_runtime_root() -> str:
@@ -19,9 +25,7 @@ def get_runtime_root() -> str:
     For PyInstaller: directory containing the executable
     For dev: directory containing this file
     """
-    if getattr(sys, "frozen", False):
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.abspath(__file__))
+    return _RUNTIME_ROOT
 
 
 def get_bundle_dir() -> str:
@@ -29,9 +33,7 @@ def get_bundle_dir() -> str:
     For PyInstaller: sys._MEIPASS (temp extraction dir)
     For dev: directory containing this file
     """
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        return sys._MEIPASS
-    return os.path.dirname(os.path.abspath(__file__))
+    return _BUNDLE_DIR
 
 
 def ensure_directories():
@@ -54,18 +56,22 @@ def load_environment():
 
 
 def _is_port_free(host: str, port: int) -> bool:
+    """
+    Definitive check: try to bind the port ourselves, with the same options
+    the server uses. SO_REUSEADDR on POSIX so TIME_WAIT leftovers from the
+    previous run don't push us off the configured port; SO_EXCLUSIVEADDRUSE on
+    Windows so a port another process holds on the wildcard address fails.
+    """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.settimeout(0.2)
-        return s.connect_ex((host, port)) != 0
-
-
-def _wait_port(host: str, port: int, timeout: float = 20.0) -> bool:
-    end = time.time() + timeout
-    while time.time() < end:
-        if not _is_port_free(host, port):  # port is now LISTENING
-            return True
-        time.sleep(0.2)
-    return False
+        try:
+            if os.name == "nt":
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind((host, port))
+        except OSError:
+            return False
+        return True
 
 
 def choose_port(host: str, preferred: int) -> int:
@@ -97,11 +103,44 @@ def _open_safari(url: str):
 
 def open_browser(host: str, port: int):
     url = f"http://{host}:{port}/"
-    if _wait_port(host, port, timeout=20):
-        print(f"\nOpening Safari at {url}\n")
-        _open_safari(url)
-    else:
-        print(f"\nWARNING: Server did not open port in time: {url}\n")
+    print(f"\nOpening Safari at {url}\n")
+    _open_safari(url)
+
+
+def server_threads() -> int:
+    """Waitress worker threads: enough to keep slow upstream calls from blocking the UI."""
+    return max(8, (os.cpu_count() or 1) * 2)
+
+
+def serve_app(app, host: str, port: int, on_ready: Optional[Callable[[], None]] = None):
+    """
+    Serve with Waitress; fall back to the threaded Werkzeug server if it is missing.
+
+    Both servers bind their socket when created, so `on_ready` (the browser
+    opener) runs once the port is listening and before the serve loop starts.
+    """
+    try:
+        from waitress import create_server
+    except ImportError:
+        print("  Waitress not available, using the built-in server")
+        from werkzeug.serving import make_server
+        server = make_server(host, port, app, threaded=True)
+        if on_ready is not None:
+            on_ready()
+        server.serve_forever()
+        return
+
+    server = create_server(
+        app,
+        host=host,
+        port=port,
+        threads=server_threads(),
+        connection_limit=1000,
+        channel_timeout=120,
+    )
+    if on_ready is not None:
+        on_ready()
+    server.run()
 
 
 def main():
@@ -122,13 +161,9 @@ def main():
     os.environ["HOST"] = host
     os.environ["PORT"] = str(port)
 
-    # Import app AFTER env/dirs are set (and before starting browser thread)
+    # Import app AFTER env/dirs are set
     from app import app
 
-    # Start browser opener thread (IMPORTANT: args=(host, port))
-    browser_thread = threading.Thread(target=open_browser, args=(host, port), daemon=True)
-    browser_thread.start()
-
     print("=" * 60)
     print("  Response Report Generator")
     print("=" * 60)
@@ -136,7 +171,7 @@ def main():
     print("  Press Ctrl+C to stop the server\n")
     print("=" * 60)
 
-    app.run(host=host, port=port, debug=False, use_reloader=False)
+    serve_app(app, host, port, on_ready=lambda: open_browser(host, port))
 
 
 if __name__ == "__main__":
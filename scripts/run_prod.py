@@ -15,8 +15,6 @@ Features:
 import os
 import sys
 import webbrowser
-import threading
-import time
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
@@ -59,8 +57,7 @@ def validate_config():
 
 
 def open_browser(port):
-    """Open the default web browser after a short delay."""
-    time.sleep(2)
+    """Open the default web browser (called once the server socket is bound)."""
     url = f"http://127.0.0.1:{port}"
     print(f"\n  Opening browser at {url}")
     webbrowser.open(url)
@@ -83,10 +80,7 @@ def main():
     print("\n  Press Ctrl+C to stop the server")
     print("=" * 60)
     
-    browser_thread = threading.Thread(target=open_browser, args=(port,), daemon=True)
-    browser_thread.start()
-    
-    from waitress import serve
+    from waitress import create_server
     
     try:
         from src.response.app import create_app
@@ -94,7 +88,16 @@ def main():
     except ImportError:
         from app import app
     
-    serve(app, host=host, port=port, threads=4)
+    server = create_server(
+        app,
+        host=host,
+        port=port,
+        threads=max(8, (os.cpu_count() or 1) * 2),
+        connection_limit=1000,
+        channel_timeout=120
+    )
+    open_browser(port)
+    server.run()
 
 
 if __name__ == '__main__':
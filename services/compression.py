@@ -0,0 +1,94 @@
+"""
+Response Compression
+
+Compresses textual responses (JSON and rendered HTML) when the client accepts
+it. Autocomplete lists, security-intel payloads and the history page run to
+tens of KB and shrink by 80-90%, which matters far more than the few ms of
+CPU on slow links.
+
+Brotli is used when the optional `brotli` package is installed and the client
+prefers it; gzip (stdlib) otherwise.
+
+Configuration (app.config):
+- COMPRESS_MIN_SIZE: smallest body worth compressing, in bytes (default 1024)
+- COMPRESS_LEVEL: gzip level 1-9 (default 5)
+- COMPRESS_BR_LEVEL: brotli quality 0-11 (default 4)
+- COMPRESS_MIMETYPES: mimetypes eligible for compression
+"""
+
+import gzip
+from typing import Optional
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_LEVEL = 5
+DEFAULT_BR_LEVEL = 4
+DEFAULT_MIMETYPES = frozenset({'application/json', 'text/html'})
+
+
+def _choose_encoding() -> Optional[str]:
+    """Pick 'br' or 'gzip' from Accept-Encoding (honouring q-values), or None."""
+    accepted = request.accept_encodings
+    br_quality = accepted.quality('br') if brotli is not None else 0
+    gzip_quality = accepted.quality('gzip')
+    if br_quality and br_quality >= gzip_quality:
+        return 'br'
+    if gzip_quality:
+        return 'gzip'
+    return None
+
+
+def init_compression(app):
+    """
+    Register an after_request hook that compresses eligible responses.
+
+    Usage:
+        from services.compression import init_compression
+        app = Flask(__name__)
+        init_compression(app)
+    """
+    app.config.setdefault('COMPRESS_MIN_SIZE', DEFAULT_MIN_SIZE)
+    app.config.setdefault('COMPRESS_LEVEL', DEFAULT_LEVEL)
+    app.config.setdefault('COMPRESS_BR_LEVEL', DEFAULT_BR_LEVEL)
+    app.config.setdefault('COMPRESS_MIMETYPES', DEFAULT_MIMETYPES)
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in app.config['COMPRESS_MIMETYPES']):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = _choose_encoding()
+        if encoding is None:
+            return response
+
+        body = response.get_data()
+        if len(body) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+
+        if encoding == 'br':
+            body = brotli.compress(body, quality=app.config['COMPRESS_BR_LEVEL'])
+        else:
+            body = gzip.compress(body, compresslevel=app.config['COMPRESS_LEVEL'])
+        response.set_data(body)
+        response.headers['Content-Encoding'] = encoding
+
+        # The encoded bytes differ from the identity body, so a strong
+        # validator would be wrong; keep the tag but mark it weak.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
+
+    return app
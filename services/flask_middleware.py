@@ -11,6 +11,19 @@ from flask import request, g, jsonify
 from services.watchdog import watchdog
 
 
+def is_api_request():
+    """
+    True if the current request wants a JSON error body.
+
+    Decided once per request in before_request (g.is_api); the fallback
+    covers errors raised before that hook has run.
+    """
+    is_api = getattr(g, 'is_api', None)
+    if is_api is None:
+        is_api = g.is_api = request.path.startswith('/api/') or request.is_json
+    return is_api
+
+
 class WatchdogMiddleware:
     """
     WSGI middleware that wraps Flask app for request/response monitoring.
@@ -30,6 +43,7 @@ class WatchdogMiddleware:
         def before_request_handler():
             """Log request start and capture timing."""
             g.watchdog_start_time = time.time()
+            g.is_api = request.path.startswith('/api/') or request.is_json
             
             watchdog.log_request_start(
                 method=request.method,
@@ -75,7 +89,7 @@ class WatchdogMiddleware:
                 }
             )
             
-            if request.is_json or request.path.startswith('/api'):
+            if is_api_request():
                 return jsonify({
                     'success': False,
                     'error': 'Internal server error'
@@ -93,7 +107,7 @@ class WatchdogMiddleware:
                 {'method': request.method, 'referrer': request.referrer}
             )
             
-            if request.is_json or request.path.startswith('/api'):
+            if is_api_request():
                 return jsonify({
                     'success': False,
                     'error': 'Not found',
@@ -112,7 +126,7 @@ class WatchdogMiddleware:
                 {'method': request.method}
             )
             
-            if request.is_json or request.path.startswith('/api'):
+            if is_api_request():
                 return jsonify({
                     'success': False,
                     'error': 'Bad request'
@@ -131,7 +145,7 @@ class WatchdogMiddleware:
                 extra_data={'path': request.path, 'method': request.method}
             )
             
-            if request.is_json or request.path.startswith('/api'):
+            if is_api_request():
                 return jsonify({
                     'success': False,
                     'error': 'Internal server error'
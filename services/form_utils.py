@@ -6,7 +6,8 @@ Reduces code duplication across routes.
 """
 
 import re
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
 
 SECURITY_ITEMS: List[Tuple[str, str]] = [
@@ -96,13 +97,8 @@ def get_empty_venue_ai_data() -> Dict[str, str]:
     }
 
 
-def get_default_form_data() -> Dict:
-    """
-    Get default form data structure with all fields initialized.
-    
-    Returns:
-        Dictionary with all form fields set to empty/default values.
-    """
+def _build_default_form_data() -> Dict:
+    """Build the default form data structure (called once at import)."""
     data = {
         'has_two_hotels': False,
         'event_start_date': '',
@@ -168,6 +164,20 @@ def get_default_form_data() -> Dict:
     return data
 
 
+# Every default is an immutable str/bool, so a shallow copy is a full copy.
+_DEFAULT_FORM_DATA: Mapping[str, Any] = MappingProxyType(_build_default_form_data())
+
+
+def get_default_form_data() -> Dict:
+    """
+    Get default form data structure with all fields initialized.
+    
+    Returns:
+        A fresh dictionary with all form fields set to empty/default values.
+    """
+    return _DEFAULT_FORM_DATA.copy()
+
+
 def build_name_address_fields(form_data: Dict) -> Dict:
     """
     Build combined name_address fields for hotels and venue.
@@ -1,28 +1,142 @@
 """
 History Persistence Module
 
-Handles saving and loading report history using a JSON file.
+Handles saving and loading report history using a JSON Lines file.
 Each report is saved with a timestamp, event details, and all form data.
-Uses atomic writes and backup mechanisms to prevent data loss.
+New reports are appended as one line; updates and deletes rewrite the file
+using atomic writes and backup mechanisms to prevent data loss.
 """
 
+import copy
 import json
+import os
+import sys
 import uuid
 import shutil
 import logging
 import tempfile
+import atexit
+import threading
+from functools import wraps
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
 
-from services.paths import get_history_file, get_history_backup_file, get_data_dir
+from services.paths import (
+    get_history_file, get_history_backup_file, get_legacy_history_file, get_data_dir
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 HISTORY_FILE: Path = get_history_file()
 BACKUP_FILE: Path = get_history_backup_file()
+LEGACY_HISTORY_FILE: Path = get_legacy_history_file()
 MAX_HISTORY_SIZE = 100
+# Appends let the file grow past MAX_HISTORY_SIZE; it is compacted back down
+# once it holds this many lines.
+COMPACT_THRESHOLD = 2 * MAX_HISTORY_SIZE
+
+# Serialises load -> mutate -> save cycles; history writes may run on
+# background threads as well as request threads.
+_history_lock = threading.RLock()
+
+# Write-behind queue for draft autosaves: the latest payload per draft id,
+# flushed in one load/save cycle by a background writer.
+DRAFT_FLUSH_INTERVAL = 0.2  # seconds to coalesce autosaves before writing
+DRAFT_FLUSH_BATCH = 50      # flush immediately once this many drafts are pending
+
+_pending_drafts: Dict[str, Tuple[Dict, Dict, datetime]] = {}
+_missing_drafts: set = set()
+_pending_lock = threading.Lock()
+_drafts_queued = threading.Event()
+_batch_full = threading.Event()
+_writer_thread: Optional[threading.Thread] = None
+
+# (file stat key, parsed history, id -> list position, lines in file) for the file as
+# last read or written, so repeat operations skip the read + parse while the
+# file is unchanged.
+_history_cache: Optional[Tuple[Tuple[int, int, int], List[Dict], Dict[str, int], int]] = None
+
+# (file stat key, summaries) for the last get_history_summary() build.
+_summary_cache: Optional[Tuple[Tuple[int, int, int], List[Dict]]] = None
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _json_line(report: Dict) -> bytes:
+    """Encode one report as a UTF-8 JSON line (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(report, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _iter_history(lines: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Decode history file lines, one JSON value per line.
+    
+    Unreadable lines (e.g. a torn append) are skipped; ValueError is raised
+    only when nothing in the file can be read.
+    """
+    parsed = 0
+    bad_lines = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            entry = _json_loads(line)
+        except ValueError:
+            bad_lines += 1
+            continue
+        parsed += 1
+        yield entry
+    if bad_lines:
+        if not parsed:
+            raise ValueError(f"none of {bad_lines} history lines could be parsed")
+        logger.warning(f"Skipped {bad_lines} unreadable history line(s)")
+
+
+def _serialize_history(history: List[Dict]) -> bytes:
+    """Encode history as JSON Lines."""
+    return b''.join(_json_line(report) for report in history)
+
+
+def _flush_pending_drafts() -> None:
+    """Write queued draft updates. Caller must hold _history_lock."""
+    with _pending_lock:
+        if not _pending_drafts:
+            return
+        items = dict(_pending_drafts)
+        _pending_drafts.clear()
+    _apply_draft_updates(items)
+
+
+def _locked(func):
+    """Run a history operation under the history lock, after queued drafts land."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _history_lock:
+            _flush_pending_drafts()
+            return func(*args, **kwargs)
+    return wrapper
 
 
 def ensure_data_directory() -> bool:
@@ -73,31 +187,33 @@ def load_history(attempt_restore: bool = True) -> List[Dict]:
         return []
     
     if not HISTORY_FILE.exists():
-        return []
+        if not LEGACY_HISTORY_FILE.exists() or not _migrate_legacy_history():
+            return []
+    
+    key = _history_stat_key()
+    cached = _history_cache
+    if key is not None and cached is not None and cached[0] == key:
+        return list(cached[1])
     
     try:
-        content = HISTORY_FILE.read_text(encoding='utf-8').strip()
-        if not content:
-            return []
-        history = json.loads(content)
-        
-        if not isinstance(history, list):
-            logger.warning("History file contains invalid data structure, returning empty list")
-            return []
+        with open(HISTORY_FILE, 'rb') as f:
+            history = list(_iter_history(f))
         
         valid_history = [r for r in history if validate_report(r)]
         if len(valid_history) != len(history):
             logger.warning(f"Filtered out {len(history) - len(valid_history)} invalid report entries")
         
         valid_history.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        return valid_history
+        del valid_history[MAX_HISTORY_SIZE:]
+        _remember_history(key, valid_history, len(history))
+        return list(valid_history)
         
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse history JSON: {e}")
+    except ValueError as e:
+        logger.error(f"Failed to parse history file: {e}")
         if attempt_restore and BACKUP_FILE.exists():
             logger.info("Attempting to restore from backup...")
             try:
-                shutil.copy2(BACKUP_FILE, HISTORY_FILE)
+                _copy_replace(BACKUP_FILE, HISTORY_FILE)
                 return load_history(attempt_restore=False)
             except Exception as restore_error:
                 logger.error(f"Failed to restore from backup: {restore_error}")
@@ -107,15 +223,165 @@ def load_history(attempt_restore: bool = True) -> List[Dict]:
         return []
 
 
-def save_history(history: List[Dict]) -> bool:
+def _fsync_file(f) -> None:
+    """Flush a written file to stable storage (F_FULLFSYNC on macOS, where fsync stops at the drive cache)."""
+    f.flush()
+    if sys.platform == 'darwin' and fcntl is not None and hasattr(fcntl, 'F_FULLFSYNC'):
+        try:
+            fcntl.fcntl(f.fileno(), fcntl.F_FULLFSYNC)
+            return
+        except OSError:
+            pass
+    os.fsync(f.fileno())
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename in directory path. No-op where directories cannot be opened (Windows)."""
+    if os.name == 'nt':
+        return
+    try:
+        dir_fd = os.open(str(path), os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _remember_history(key: Optional[Tuple[int, int, int]], history: List[Dict],
+                      stored: Optional[int] = None) -> None:
+    """Cache history as the parsed contents of the file identified by key."""
+    global _history_cache
+    if key is None:
+        _history_cache = None
+        return
+    _history_cache = (
+        key,
+        history,
+        {report.get('id'): i for i, report in enumerate(history)},
+        len(history) if stored is None else stored,
+    )
+
+
+def _migrate_legacy_history() -> bool:
+    """
+    Convert the old single-array history file to JSON Lines.
+    
+    The old file is kept, renamed with a '.migrated' suffix.
+    
+    Returns:
+        True if HISTORY_FILE now exists, False otherwise.
+    """
+    try:
+        history = _json_loads(LEGACY_HISTORY_FILE.read_bytes() or b'[]')
+    except (ValueError, OSError) as e:
+        logger.error(f"Failed to read legacy history file: {e}")
+        return False
+    if not isinstance(history, list):
+        logger.warning("Legacy history file contains invalid data structure, not migrating")
+        return False
+    if not save_history([r for r in history if validate_report(r)]):
+        return False
+    try:
+        LEGACY_HISTORY_FILE.replace(LEGACY_HISTORY_FILE.with_name(LEGACY_HISTORY_FILE.name + '.migrated'))
+    except OSError as e:
+        logger.warning(f"Failed to rename legacy history file: {e}")
+    logger.info(f"Migrated {len(history)} report(s) to {HISTORY_FILE.name}")
+    return True
+
+
+def _append_report(report: Dict, history: List[Dict], stored: int) -> bool:
+    """
+    Append one report line to HISTORY_FILE without rewriting it.
+    
+    Args:
+        report: The new report.
+        history: The history list including the new report, for the cache.
+        stored: Number of lines in the file after the append.
+    
+    Returns:
+        True if successful, False otherwise.
+    """
+    try:
+        with open(HISTORY_FILE, 'a+b') as f:
+            line = _json_line(report)
+            if f.tell():
+                # Start on a fresh line if a previous append was cut short.
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            f.write(line)
+            _fsync_file(f)
+    except Exception as e:
+        logger.error(f"Failed to append to history: {e}")
+        _remember_history(None, [])
+        return False
+    _remember_history(_history_stat_key(), history, stored)
+    return True
+
+
+def _copy_replace(src: Path, dst: Path) -> None:
+    """Copy src over dst via an fsync'd temp file and os.replace (never onto dst's inode)."""
+    target = dst.resolve()
+    fd, temp_path = tempfile.mkstemp(suffix='.ndjson', dir=str(target.parent))
+    try:
+        with open(fd, 'wb') as f, open(src, 'rb') as source:
+            shutil.copyfileobj(source, f)
+            _fsync_file(f)
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(target.parent)
+
+
+def _backup_history() -> None:
     """
-    Save the history list to the JSON file using atomic write.
+    Point BACKUP_FILE at the current history contents.
+    
+    Called just before save_history swaps in a new inode, so a hard link keeps
+    the previous version without copying it: later appends go to the new
+    HISTORY_FILE, not to the backup. If the save then fails, the link would
+    still share the live inode; save_history detaches it (_detach_backup).
+    Falls back to a copy where links are unsupported.
+    """
+    try:
+        BACKUP_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(HISTORY_FILE, BACKUP_FILE)
+    except OSError:
+        shutil.copy2(HISTORY_FILE, BACKUP_FILE)
+
+
+def _detach_backup() -> None:
+    """Give BACKUP_FILE its own inode if it is still linked to HISTORY_FILE."""
+    try:
+        if os.path.samefile(BACKUP_FILE, HISTORY_FILE):
+            _copy_replace(HISTORY_FILE, BACKUP_FILE)
+    except OSError as e:
+        logger.warning(f"Failed to detach history backup: {e}")
+
+
+def save_history(history: List[Dict], *, fsync: bool = True) -> bool:
+    """
+    Save the history list to the JSON Lines file using atomic write.
     
     Uses a temporary file and rename to prevent corruption during write.
     Creates a backup of the existing file before overwriting.
     
     Args:
         history: List of report dictionaries.
+        fsync: Flush the file and directory to disk before returning. Pass
+               False for writes that are cheap to redo (e.g. clearing history):
+               the rename stays atomic, but a power cut may roll it back.
         
     Returns:
         True if successful, False otherwise.
@@ -130,19 +396,27 @@ def save_history(history: List[Dict]) -> bool:
     try:
         if HISTORY_FILE.exists():
             try:
-                shutil.copy2(HISTORY_FILE, BACKUP_FILE)
+                _backup_history()
             except Exception as backup_error:
                 logger.warning(f"Failed to create backup: {backup_error}")
         
-        data_dir = HISTORY_FILE.parent
-        fd, temp_path = tempfile.mkstemp(suffix='.json', dir=str(data_dir))
+        # Write next to the real file (through any symlinks) so os.replace is
+        # a same-filesystem rename and replaces the file, not the link.
+        target = HISTORY_FILE.resolve()
+        data_dir = target.parent
+        fd, temp_path = tempfile.mkstemp(suffix='.ndjson', dir=str(data_dir))
         temp_file = Path(temp_path)
         
         try:
-            with open(fd, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            with open(fd, 'wb') as f:
+                f.write(_serialize_history(history))
+                if fsync:
+                    _fsync_file(f)
             
-            shutil.move(str(temp_file), str(HISTORY_FILE))
+            os.replace(temp_file, target)
+            if fsync:
+                _fsync_dir(data_dir)
+            _remember_history(_history_stat_key(), list(history))
             return True
             
         except Exception as write_error:
@@ -155,13 +429,23 @@ def save_history(history: List[Dict]) -> bool:
             
     except Exception as e:
         logger.error(f"Failed to save history: {e}")
+        # The backup link was taken but the old inode stayed live: appends
+        # (including a torn one) would otherwise change the backup too.
+        _detach_backup()
+        # Callers may have mutated cached entries before the failed write;
+        # make the next load re-read the file.
+        _remember_history(None, [])
         return False
 
 
+@_locked
 def add_report_to_history(form_data: Dict, security_data: Dict, pdf_filename: Optional[str] = None, is_draft: bool = False) -> Optional[str]:
     """
     Add a new report to the history.
     
+    form_data and security_data are stored as-is, not copied: callers must
+    not mutate them after the call.
+    
     Args:
         form_data: The form data dictionary.
         security_data: The security items data.
@@ -176,6 +460,8 @@ def add_report_to_history(form_data: Dict, security_data: Dict, pdf_filename: Op
         return None
     
     history = load_history()
+    cached = _history_cache
+    stored = cached[3] if cached is not None and cached[0] == _history_stat_key() else len(history)
     
     report_id = str(uuid.uuid4())[:8]
     now = datetime.now()
@@ -204,19 +490,24 @@ def add_report_to_history(form_data: Dict, security_data: Dict, pdf_filename: Op
         'event_start_date': form_data.get('event_start_date', ''),
         'event_end_date': form_data.get('event_end_date', ''),
         'pdf_filename': pdf_filename,
-        'form_data': form_data.copy(),
-        'security_data': security_data.copy() if security_data else {},
+        'form_data': form_data,
+        'security_data': security_data or {},
         'questionnaire_id': questionnaire_id,
         'is_draft': is_draft,
         'status': 'draft' if is_draft else 'completed'
     }
     
+    # history is the cached list (no parse); at MAX_HISTORY_SIZE entries the
+    # prepend and cap are negligible next to the fsync'd append below.
     history.insert(0, report)
+    del history[MAX_HISTORY_SIZE:]
     
-    if len(history) > MAX_HISTORY_SIZE:
-        history = history[:MAX_HISTORY_SIZE]
+    if stored + 1 >= COMPACT_THRESHOLD:
+        saved = save_history(history)
+    else:
+        saved = _append_report(report, history, stored + 1)
     
-    if save_history(history):
+    if saved:
         logger.info(f"Report {report_id} ({'draft' if is_draft else 'completed'}) added to history")
         if questionnaire_id:
             try:
@@ -229,10 +520,40 @@ def add_report_to_history(form_data: Dict, security_data: Dict, pdf_filename: Op
     return None
 
 
+def _apply_draft_fields(report: Dict, form_data: Dict, security_data: Dict, now: datetime) -> None:
+    """Copy the updatable form fields onto a history entry."""
+    report['updated_at'] = now.isoformat()
+    report['updated_at_formatted'] = now.strftime('%Y-%m-%d %H:%M')
+    report['event_type'] = form_data.get('event_type', 'Disney On Ice')
+    report['city'] = form_data.get('event_city', '')
+    report['venue_name'] = form_data.get('venue_name', '')
+    report['hotel_name'] = form_data.get('hotel1_name', '')
+    report['hotel2_name'] = form_data.get('hotel2_name', '') if form_data.get('has_two_hotels') else ''
+    report['event_start_date'] = form_data.get('event_start_date', '')
+    report['event_end_date'] = form_data.get('event_end_date', '')
+    report['form_data'] = form_data
+    report['security_data'] = security_data or {}
+
+
+def _load_indexed() -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Load history plus an ID -> position index into the returned list.
+    Caller must hold _history_lock.
+    """
+    history = load_history()
+    cached = _history_cache
+    if cached is not None and cached[0] == _history_stat_key():
+        return history, cached[2]
+    return history, {report.get('id'): i for i, report in enumerate(history)}
+
+
+@_locked
 def update_draft(report_id: str, form_data: Dict, security_data: Dict) -> bool:
     """
     Update an existing draft report.
     
+    As with add_report_to_history, the dicts are stored without copying.
+    
     Args:
         report_id: The unique report ID.
         form_data: The updated form data dictionary.
@@ -245,32 +566,130 @@ def update_draft(report_id: str, form_data: Dict, security_data: Dict) -> bool:
         logger.warning("Cannot update draft: invalid report_id")
         return False
     
-    history = load_history()
-    now = datetime.now()
+    history, positions = _load_indexed()
+    idx = positions.get(report_id)
     
-    for i, report in enumerate(history):
-        if report.get('id') == report_id:
-            history[i]['updated_at'] = now.isoformat()
-            history[i]['updated_at_formatted'] = now.strftime('%Y-%m-%d %H:%M')
-            history[i]['event_type'] = form_data.get('event_type', 'Disney On Ice')
-            history[i]['city'] = form_data.get('event_city', '')
-            history[i]['venue_name'] = form_data.get('venue_name', '')
-            history[i]['hotel_name'] = form_data.get('hotel1_name', '')
-            history[i]['hotel2_name'] = form_data.get('hotel2_name', '') if form_data.get('has_two_hotels') else ''
-            history[i]['event_start_date'] = form_data.get('event_start_date', '')
-            history[i]['event_end_date'] = form_data.get('event_end_date', '')
-            history[i]['form_data'] = form_data.copy()
-            history[i]['security_data'] = security_data.copy() if security_data else {}
-            
-            if save_history(history):
-                logger.info(f"Draft {report_id} updated")
-                return True
-            return False
+    if idx is not None:
+        _apply_draft_fields(history[idx], form_data, security_data, datetime.now())
+        
+        if save_history(history):
+            logger.info(f"Draft {report_id} updated")
+            return True
+        return False
     
     logger.warning(f"Draft {report_id} not found")
     return False
 
 
+def _apply_draft_updates(items: Dict[str, Tuple[Dict, Dict, datetime]]) -> Dict[str, bool]:
+    """Apply several draft updates with a single load/save. Caller must hold _history_lock."""
+    history, positions = _load_indexed()
+    
+    found = {}
+    for report_id, (form_data, security_data, queued_at) in items.items():
+        idx = positions.get(report_id)
+        if idx is None:
+            found[report_id] = False
+            continue
+        _apply_draft_fields(history[idx], form_data, security_data, queued_at)
+        found[report_id] = True
+    
+    missing = [report_id for report_id, ok in found.items() if not ok]
+    if missing:
+        logger.warning(f"Drafts not found: {', '.join(missing)}")
+        with _pending_lock:
+            _missing_drafts.update(missing)
+    
+    if len(missing) == len(items):
+        return found
+    
+    if save_history(history):
+        logger.info(f"{len(items) - len(missing)} draft(s) updated")
+        return found
+    return {report_id: False for report_id in items}
+
+
+@_locked
+def bulk_update_drafts(items: Dict[str, Tuple[Dict, Dict, datetime]]) -> Dict[str, bool]:
+    """
+    Update several drafts in one load/save cycle.
+    
+    Args:
+        items: Mapping of report ID to (form_data, security_data, updated_at).
+        
+    Returns:
+        Mapping of report ID to whether it was updated.
+    """
+    return _apply_draft_updates(items)
+
+
+def _draft_writer_loop() -> None:
+    while True:
+        _drafts_queued.wait()
+        _batch_full.wait(DRAFT_FLUSH_INTERVAL)
+        _drafts_queued.clear()
+        _batch_full.clear()
+        try:
+            flush_pending_drafts()
+        except Exception as e:
+            logger.error(f"Failed to flush queued drafts: {e}")
+
+
+def _ensure_draft_writer() -> None:
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _pending_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_draft_writer_loop, name='draft-writer', daemon=True
+            )
+            _writer_thread.start()
+
+
+def queue_draft_update(report_id: str, form_data: Dict, security_data: Dict) -> bool:
+    """
+    Queue a draft autosave for the background writer.
+    
+    Rapid saves of the same draft are coalesced: only the latest payload is
+    written, DRAFT_FLUSH_INTERVAL after the first one was queued. The dicts
+    are stored without copying, so callers must not mutate them afterwards.
+    
+    Args:
+        report_id: The unique report ID.
+        form_data: The updated form data dictionary.
+        security_data: The updated security items data.
+        
+    Returns:
+        False if the draft is known not to exist (e.g. it was deleted),
+        in which case nothing is queued; True otherwise.
+    """
+    if not report_id or not isinstance(report_id, str):
+        return False
+    
+    with _pending_lock:
+        if report_id in _missing_drafts:
+            return False
+        _pending_drafts[report_id] = (form_data, security_data, datetime.now())
+        pending = len(_pending_drafts)
+    
+    _ensure_draft_writer()
+    _drafts_queued.set()
+    if pending >= DRAFT_FLUSH_BATCH:
+        _batch_full.set()
+    return True
+
+
+def flush_pending_drafts() -> None:
+    """Write any queued draft updates now."""
+    with _history_lock:
+        _flush_pending_drafts()
+
+
+atexit.register(flush_pending_drafts)
+
+
+@_locked
 def convert_draft_to_completed(report_id: str, pdf_filename: Optional[str] = None) -> bool:
     """
     Convert a draft to a completed report.
@@ -285,19 +704,20 @@ def convert_draft_to_completed(report_id: str, pdf_filename: Optional[str] = Non
     if not report_id or not isinstance(report_id, str):
         return False
     
-    history = load_history()
+    history, positions = _load_indexed()
+    idx = positions.get(report_id)
     
-    for i, report in enumerate(history):
-        if report.get('id') == report_id:
-            history[i]['is_draft'] = False
-            history[i]['status'] = 'completed'
-            history[i]['pdf_filename'] = pdf_filename
-            history[i]['completed_at'] = datetime.now().isoformat()
-            
-            if save_history(history):
-                logger.info(f"Draft {report_id} converted to completed")
-                return True
-            return False
+    if idx is not None:
+        report = history[idx]
+        report['is_draft'] = False
+        report['status'] = 'completed'
+        report['pdf_filename'] = pdf_filename
+        report['completed_at'] = datetime.now().isoformat()
+        
+        if save_history(history):
+            logger.info(f"Draft {report_id} converted to completed")
+            return True
+        return False
     
     return False
 
@@ -315,15 +735,15 @@ def get_report_by_id(report_id: str) -> Optional[Dict]:
     if not report_id or not isinstance(report_id, str):
         return None
     
-    history = load_history()
-    
-    for report in history:
-        if report.get('id') == report_id:
-            return report
-    
-    return None
+    with _history_lock:
+        _flush_pending_drafts()
+        history, positions = _load_indexed()
+        idx = positions.get(report_id)
+        # Entries are shared with the cache; callers get their own copy.
+        return copy.deepcopy(history[idx]) if idx is not None else None
 
 
+@_locked
 def delete_report(report_id: str) -> bool:
     """
     Delete a report from history.
@@ -338,13 +758,14 @@ def delete_report(report_id: str) -> bool:
         logger.warning("Cannot delete report: invalid report_id")
         return False
     
-    history = load_history()
-    
-    original_length = len(history)
-    history = [r for r in history if r.get('id') != report_id]
+    history, positions = _load_indexed()
+    idx = positions.get(report_id)
     
-    if len(history) < original_length:
+    if idx is not None:
+        del history[idx]
         if save_history(history):
+            with _pending_lock:
+                _missing_drafts.add(report_id)
             logger.info(f"Report {report_id} deleted from history")
             return True
         logger.error(f"Failed to save history after deleting report {report_id}")
@@ -354,36 +775,93 @@ def delete_report(report_id: str) -> bool:
     return False
 
 
+def _history_stat_key() -> Optional[Tuple[int, int, int]]:
+    """Identify the current history file contents by inode, mtime and size."""
+    try:
+        st = HISTORY_FILE.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def get_history_version() -> str:
+    """
+    Get an opaque token that changes whenever the history file is rewritten.
+    
+    Suitable as an HTTP ETag: it costs one stat() and no parsing.
+    
+    Returns:
+        Hex token, or 'empty' when no history file exists yet.
+    """
+    flush_pending_drafts()
+    key = _history_stat_key()
+    if key is None:
+        return 'empty'
+    return '-'.join(f'{part:x}' for part in key)
+
+
+def _summarize_report(report: Dict) -> Dict:
+    """Project a history entry onto the fields shown in history listings."""
+    return {
+        'id': report.get('id'),
+        'created_at': report.get('created_at'),
+        'created_at_formatted': report.get('created_at_formatted'),
+        'updated_at_formatted': report.get('updated_at_formatted'),
+        'event_type': report.get('event_type'),
+        'city': report.get('city'),
+        'venue_name': report.get('venue_name'),
+        'hotel_name': report.get('hotel_name'),
+        'hotel2_name': report.get('hotel2_name'),
+        'event_start_date': report.get('event_start_date'),
+        'event_end_date': report.get('event_end_date'),
+        'is_draft': report.get('is_draft', False),
+        'status': report.get('status', 'completed'),
+    }
+
+
 def get_history_summary() -> List[Dict]:
     """
     Get a summary of all reports (without full form data).
     
+    The summary is rebuilt only when the history file has changed on disk
+    (same inode/mtime/size key as the history cache). Each call gets its own
+    list, but the summary dicts are shared between calls and must not be
+    modified.
+    
     Returns:
         List of report summaries with key fields only.
     """
-    history = load_history()
-    
-    summaries = []
-    for report in history:
-        summaries.append({
-            'id': report.get('id'),
-            'created_at': report.get('created_at'),
-            'created_at_formatted': report.get('created_at_formatted'),
-            'updated_at_formatted': report.get('updated_at_formatted'),
-            'event_type': report.get('event_type'),
-            'city': report.get('city'),
-            'venue_name': report.get('venue_name'),
-            'hotel_name': report.get('hotel_name'),
-            'hotel2_name': report.get('hotel2_name'),
-            'event_start_date': report.get('event_start_date'),
-            'event_end_date': report.get('event_end_date'),
-            'is_draft': report.get('is_draft', False),
-            'status': report.get('status', 'completed'),
-        })
-    
-    return summaries
+    global _summary_cache
+    
+    flush_pending_drafts()
+    key = _history_stat_key()
+    cached = _summary_cache
+    if key is not None and cached is not None and cached[0] == key:
+        return list(cached[1])
+    
+    summaries = None
+    history_cached = _history_cache
+    if key is not None and (history_cached is None or history_cached[0] != key):
+        # Full entries are not in memory: stream the file and keep only the
+        # summary fields, so form/security data is never held all at once.
+        try:
+            with open(HISTORY_FILE, 'rb') as f:
+                summaries = [_summarize_report(r) for r in _iter_history(f) if validate_report(r)]
+            summaries.sort(key=lambda x: x.get('created_at') or '', reverse=True)
+            del summaries[MAX_HISTORY_SIZE:]
+        except (ValueError, OSError):
+            summaries = None  # load_history() below logs and restores from backup
+    
+    if summaries is None:
+        summaries = [_summarize_report(report) for report in load_history()]
+        key = _history_stat_key()
+    
+    if key is not None:
+        _summary_cache = (key, summaries)
+    return list(summaries)
 
 
+@_locked
 def clear_all_history() -> bool:
     """
     Clear all history entries.
@@ -391,8 +869,11 @@ def clear_all_history() -> bool:
     Returns:
         True if successful, False otherwise.
     """
-    result = save_history([])
+    cleared_ids = [report.get('id') for report in load_history()]
+    result = save_history([], fsync=False)
     if result:
+        with _pending_lock:
+            _missing_drafts.update(cleared_ids)
         logger.info("All history cleared")
     else:
         logger.error("Failed to clear history")
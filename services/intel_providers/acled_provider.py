@@ -12,26 +12,132 @@ Set ACLED_EMAIL and ACLED_API_KEY environment variables.
 """
 
 import os
+import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 ACLED_BASE_URL = "https://api.acleddata.com/acled/read"
 
+# Successful responses, keyed on the query parameters. ACLED publishes
+# updates daily, so an hour-old answer is as good as a fresh one.
+RESPONSE_CACHE_TTL_SECONDS = 3600
+RESPONSE_CACHE_MAX_ENTRIES = 128
+
+_response_cache = ResponseCache(RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES)
+
+# Shared across providers (one is created per lookup) so consecutive queries
+# reuse the keep-alive TLS connection to the API.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                      allowed_methods=['GET'], raise_on_status=False)
+))
+
 EVENT_TYPES = {
     'violent': ['Battles', 'Explosions/Remote violence', 'Violence against civilians'],
     'demonstrations': ['Protests', 'Riots'],
     'strategic': ['Strategic developments']
 }
 
+# event_type query values, joined once.
+_VIOLENT_EVENT_FILTER = '|'.join(EVENT_TYPES['violent'])
+_DEMO_EVENT_FILTER = '|'.join(EVENT_TYPES['demonstrations'])
+
 DISORDER_TYPES = {
     'political_violence': 'Political violence',
     'demonstrations': 'Demonstrations'
 }
 
+# Event fields matched against the requested city, most specific last.
+CITY_FIELDS = ('admin1', 'admin2', 'admin3', 'location')
+
+# Only the columns the providers read are requested; ACLED rows carry ~30,
+# so this trims the 500-event responses substantially before download/parse.
+EVENT_FIELDS = '|'.join((
+    'event_id_cnty', 'event_date', 'event_type', 'sub_event_type',
+    *CITY_FIELDS, 'fatalities', 'notes', 'source', 'source_scale',
+    'latitude', 'longitude', 'actor1', 'actor2',
+))
+
+
+def _filter_by_city(events: List[Dict], city: Optional[str]) -> Tuple[List[Dict], str]:
+    """
+    Keep events whose admin areas or location mention the city.
+    
+    Falls back to all events (country scope) when none match.
+    
+    Returns:
+        (events, scope label)
+    """
+    if not city:
+        return events, 'Country'
+    
+    # One case-insensitive scan over the joined fields; the separator keeps a
+    # match from spanning two fields.
+    search = re.compile(re.escape(city), re.IGNORECASE).search
+    city_events = [
+        e for e in events
+        if search('\x1f'.join([e.get(field) or '' for field in CITY_FIELDS]))
+    ]
+    if city_events:
+        return city_events, 'City'
+    return events, 'Country (city-level data not available)'
+
+
+def _aggregate_events(events: List[Dict], days: int) -> Dict:
+    """
+    Compute all per-event aggregates in one pass.
+    
+    Returns:
+        Dict with total 'fatalities', 'first_half'/'second_half' event counts
+        either side of the period midpoint, and counts 'by_type' (event_type).
+    """
+    # ISO dates order the same as strings. Events dated on the midpoint
+    # day itself fall before the midpoint instant, hence the strict '>'.
+    mid_date = (datetime.now() - timedelta(days=days // 2)).strftime('%Y-%m-%d')
+    
+    fatalities = 0
+    first_half = 0
+    second_half = 0
+    by_type: Dict[str, int] = {}
+    
+    for event in events:
+        fatalities += int(event.get('fatalities', 0) or 0)
+        
+        event_type = event.get('event_type')
+        by_type[event_type] = by_type.get(event_type, 0) + 1
+        
+        event_date = event.get('event_date') or ''
+        if len(event_date) != 10 or event_date[4] != '-' or event_date[7] != '-':
+            continue
+        if event_date > mid_date:
+            second_half += 1
+        else:
+            first_half += 1
+    
+    return {
+        'fatalities': fatalities,
+        'first_half': first_half,
+        'second_half': second_half,
+        'by_type': by_type,
+    }
+
 
 class ACLEDProvider:
     """Provider for ACLED conflict event data."""
@@ -41,13 +147,14 @@ class ACLEDProvider:
         self.api_key = os.environ.get('ACLED_API_KEY', '')
         self.base_url = ACLED_BASE_URL
         self.timeout = 30
+        self.session = _session
     
     def is_configured(self) -> bool:
         """Check if ACLED credentials are configured."""
         return bool(self.email and self.api_key)
     
     def _make_request(self, params: Dict) -> Dict:
-        """Make request to ACLED API."""
+        """Make request to ACLED API; successful answers are reused for RESPONSE_CACHE_TTL_SECONDS."""
         if not self.is_configured():
             return {
                 'success': False,
@@ -55,19 +162,33 @@ class ACLEDProvider:
                 'data': []
             }
         
+        cache_key = tuple(sorted(params.items()))
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = self._fetch(params)
+        if result['success']:
+            _response_cache.set(cache_key, result)
+        return result
+    
+    def _fetch(self, params: Dict) -> Dict:
+        """Query the ACLED API (uncached)."""
+        params = dict(params)
         params['email'] = self.email
         params['key'] = self.api_key
         params['_format'] = 'json'
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
-                data = response.json()
+                # Up to 500 events per query; orjson parses them several times faster.
+                data = orjson.loads(response.content) if orjson is not None else response.json()
                 if data.get('success', True):
                     return {
                         'success': True,
@@ -112,6 +233,13 @@ class ACLEDProvider:
                 'error': str(e),
                 'data': []
             }
+        except ValueError as e:
+            logger.error(f'ACLED response parse error: {e}')
+            return {
+                'success': False,
+                'error': 'Invalid JSON from ACLED API',
+                'data': []
+            }
     
     def get_violent_incidents(self, country: str, city: Optional[str] = None,
                                days: int = 30) -> Dict:
@@ -133,7 +261,8 @@ class ACLEDProvider:
             'country': country,
             'event_date_where': 'BETWEEN',
             'event_date': f'{start_date.strftime("%Y-%m-%d")}:{end_date.strftime("%Y-%m-%d")}',
-            'event_type': '|'.join(EVENT_TYPES['violent']),
+            'event_type': _VIOLENT_EVENT_FILTER,
+            'fields': EVENT_FIELDS,
             'limit': 500
         }
         
@@ -151,24 +280,8 @@ class ACLEDProvider:
         
         events = result.get('data', [])
         
-        if city:
-            city_lower = city.lower()
-            city_events = [
-                e for e in events 
-                if city_lower in e.get('admin1', '').lower() or
-                   city_lower in e.get('admin2', '').lower() or
-                   city_lower in e.get('admin3', '').lower() or
-                   city_lower in e.get('location', '').lower()
-            ]
-            if city_events:
-                events = city_events
-                scope = 'City'
-            else:
-                scope = 'Country (city-level data not available)'
-        else:
-            scope = 'Country'
-        
-        total_fatalities = sum(int(e.get('fatalities', 0) or 0) for e in events)
+        events, scope = _filter_by_city(events, city)
+        totals = _aggregate_events(events, days)
         
         incidents = []
         for event in events[:20]:
@@ -190,13 +303,13 @@ class ACLEDProvider:
                 'actor2': event.get('actor2', '')
             })
         
-        trend = self._calculate_trend(events, days)
+        trend = self._calculate_trend(len(events), totals['first_half'], totals['second_half'])
         
         return {
             'success': True,
             'incidents': incidents,
             'total_incidents': len(events),
-            'total_fatalities': total_fatalities,
+            'total_fatalities': totals['fatalities'],
             'scope': scope,
             'trend': trend,
             'period_days': days,
@@ -223,7 +336,8 @@ class ACLEDProvider:
             'country': country,
             'event_date_where': 'BETWEEN',
             'event_date': f'{start_date.strftime("%Y-%m-%d")}:{end_date.strftime("%Y-%m-%d")}',
-            'event_type': '|'.join(EVENT_TYPES['demonstrations']),
+            'event_type': _DEMO_EVENT_FILTER,
+            'fields': EVENT_FIELDS,
             'limit': 500
         }
         
@@ -240,22 +354,7 @@ class ACLEDProvider:
         
         events = result.get('data', [])
         
-        if city:
-            city_lower = city.lower()
-            city_events = [
-                e for e in events 
-                if city_lower in e.get('admin1', '').lower() or
-                   city_lower in e.get('admin2', '').lower() or
-                   city_lower in e.get('admin3', '').lower() or
-                   city_lower in e.get('location', '').lower()
-            ]
-            if city_events:
-                events = city_events
-                scope = 'City'
-            else:
-                scope = 'Country (city-level data not available)'
-        else:
-            scope = 'Country'
+        events, scope = _filter_by_city(events, city)
         
         demonstrations = []
         for event in events[:15]:
@@ -274,40 +373,24 @@ class ACLEDProvider:
                 'actor1': event.get('actor1', '')
             })
         
-        protests = [e for e in events if e.get('event_type') == 'Protests']
-        riots = [e for e in events if e.get('event_type') == 'Riots']
+        by_type = _aggregate_events(events, days)['by_type']
         
         return {
             'success': True,
             'demonstrations': demonstrations,
             'total_count': len(events),
-            'protests_count': len(protests),
-            'riots_count': len(riots),
+            'protests_count': by_type.get('Protests', 0),
+            'riots_count': by_type.get('Riots', 0),
             'scope': scope,
             'period_days': days,
             'source': 'ACLED'
         }
     
-    def _calculate_trend(self, events: List[Dict], days: int) -> str:
+    def _calculate_trend(self, total: int, first_half: int, second_half: int) -> str:
         """Calculate trend by comparing first half to second half of period."""
-        if len(events) < 2:
+        if total < 2:
             return 'stable'
         
-        mid_date = datetime.now() - timedelta(days=days // 2)
-        
-        first_half = 0
-        second_half = 0
-        
-        for event in events:
-            try:
-                event_date = datetime.strptime(event.get('event_date', ''), '%Y-%m-%d')
-                if event_date >= mid_date:
-                    second_half += 1
-                else:
-                    first_half += 1
-            except ValueError:
-                continue
-        
         if first_half == 0:
             return 'increasing' if second_half > 0 else 'stable'
         
@@ -322,8 +405,12 @@ class ACLEDProvider:
     
     def get_country_summary(self, country: str) -> Dict:
         """Get summary statistics for a country."""
-        incidents = self.get_violent_incidents(country, days=30)
-        demos = self.get_demonstrations(country, days=14)
+        # The two queries are independent: fetch demonstrations on a helper
+        # thread while this one fetches incidents.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='acled') as executor:
+            demos_future = executor.submit(self.get_demonstrations, country, days=14)
+            incidents = self.get_violent_incidents(country, days=30)
+            demos = demos_future.result()
         
         return {
             'country': country,
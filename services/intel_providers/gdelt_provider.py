@@ -8,10 +8,126 @@ articles based on city and country.
 No API key required. Completely free.
 """
 
+import re
+import time
+import threading
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
+from typing import List, Dict, Optional, Sequence, Tuple
+from functools import lru_cache
+
+from .response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# GDELT re-indexes every 15 minutes; identical queries within that window
+# return the same articles.
+CACHE_TTL_SECONDS = 900
+
+# GDELT DOC API ignores maxrecords above this.
+MAX_RECORDS_LIMIT = 250
+_cache = ResponseCache(CACHE_TTL_SECONDS)
+
+# Shared across providers (one is created per lookup) so queries reuse
+# keep-alive connections; transient 5xx answers are retried with backoff
+# (429 is handled by _rate_limited_get, since an immediate retry would fail).
+# The pool keeps connections alive between reports, so TLS handshakes are
+# paid once per process rather than per run (HTTP/2 multiplexing would need
+# httpx + h2 and an event loop, and the rate gate below spaces requests anyway).
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'SecurityIntelligenceApp/1.0'
+})
+_adapter = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=['GET'], raise_on_status=False)
+)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# The DOC API allows about one request per 5 seconds per client and answers
+# 429 beyond that. Every GDELT request in the process (report fallbacks, news
+# context, category fan-out) is spaced through this gate.
+MIN_REQUEST_INTERVAL = 5.0
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _wait_for_slot() -> None:
+    """Block until this process may send its next GDELT request."""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        delay = _next_request_at - now
+        if delay > 0:
+            time.sleep(delay)
+            now += delay
+        _next_request_at = now + MIN_REQUEST_INTERVAL
+
+
+def _rate_limited_get(session: requests.Session, url: str, params: Dict,
+                      timeout: int) -> requests.Response:
+    """GET through the rate gate; a 429 is retried once, a full interval later."""
+    _wait_for_slot()
+    response = session.get(url, params=params, timeout=timeout)
+    if response.status_code == 429:
+        _wait_for_slot()
+        response = session.get(url, params=params, timeout=timeout)
+    return response
+
+
+_NON_WORD = re.compile(r'\W+')
+
+
+def _flatten_keywords(keyword_dict: Dict[str, List[str]]) -> Tuple[str, ...]:
+    """Flatten all language keywords into one de-duplicated tuple (first occurrence order)."""
+    return tuple(dict.fromkeys(kw for lang_keywords in keyword_dict.values() for kw in lang_keywords))
+
+
+@lru_cache(maxsize=32)
+def _keyword_clause(keywords: Tuple[str, ...]) -> str:
+    """Quoted OR-group for a keyword tuple; the category tuples are shared across cities."""
+    return "(" + " OR ".join(f'"{kw}"' for kw in keywords) + ")"
+
+
+@lru_cache(maxsize=512)
+def _build_query_string(city: str, country: str, keywords: Tuple[str, ...],
+                        city_aliases: Optional[Tuple[str, ...]]) -> str:
+    """Memoised body of GDELTProvider._build_query; a report run repeats the same queries."""
+    location_terms = []
+
+    if country:
+        location_terms.append(f'"{country}"')
+
+    city_terms = []
+    if city:
+        city_terms.append(f'"{city}"')
+        if city_aliases:
+            for alias in city_aliases:
+                if alias and alias.lower() != city.lower():
+                    city_terms.append(f'"{alias}"')
+
+    if city_terms:
+        city_query = "(" + " OR ".join(city_terms) + ")"
+        location_terms.append(city_query)
+
+    location_query = " AND ".join(location_terms) if location_terms else ""
+
+    keyword_query = _keyword_clause(keywords)
+
+    if location_query and keyword_query:
+        return f"{location_query} AND {keyword_query}"
+    elif location_query:
+        return location_query
+    else:
+        return keyword_query
 
 
 class GDELTProvider:
@@ -45,14 +161,15 @@ class GDELTProvider:
         'es': ['crimen', 'robo', 'asalto', 'hurto', 'violencia', 'ataque']
     }
     
+    ALL_HOMICIDE_KEYWORDS = _flatten_keywords(HOMICIDE_KEYWORDS)
+    ALL_DEMONSTRATION_KEYWORDS = _flatten_keywords(DEMONSTRATION_KEYWORDS)
+    ALL_CRIME_KEYWORDS = _flatten_keywords(CRIME_KEYWORDS)
+    
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SecurityIntelligenceApp/1.0'
-        })
+        self.session = _session
     
-    def _build_query(self, city: str, country: str, keywords: List[str], 
+    def _build_query(self, city: str, country: str, keywords: Sequence[str], 
                      days: int = 30, city_aliases: Optional[List[str]] = None) -> str:
         """
         Build GDELT query string with optional city aliases.
@@ -68,62 +185,36 @@ class GDELTProvider:
             GDELT query string like:
             "Mexico" AND ("Mexico City" OR "CDMX") AND (keywords)
         """
-        location_terms = []
-        
-        if country:
-            location_terms.append(f'"{country}"')
-        
-        city_terms = []
-        if city:
-            city_terms.append(f'"{city}"')
-            if city_aliases:
-                for alias in city_aliases:
-                    if alias and alias.lower() != city.lower():
-                        city_terms.append(f'"{alias}"')
-        
-        if city_terms:
-            city_query = "(" + " OR ".join(city_terms) + ")"
-            location_terms.append(city_query)
-        
-        location_query = " AND ".join(location_terms) if location_terms else ""
-        
-        keyword_query = "(" + " OR ".join([f'"{kw}"' for kw in keywords]) + ")"
-        
-        if location_query and keyword_query:
-            return f"{location_query} AND {keyword_query}"
-        elif location_query:
-            return location_query
-        else:
-            return keyword_query
-    
-    def _get_all_keywords(self, keyword_dict: Dict[str, List[str]]) -> List[str]:
-        """Flatten all language keywords into a single list."""
-        all_keywords = []
-        for lang_keywords in keyword_dict.values():
-            all_keywords.extend(lang_keywords)
-        return list(set(all_keywords))
+        return _build_query_string(
+            city, country, tuple(keywords),
+            tuple(city_aliases) if city_aliases else None
+        )
     
     def _parse_gdelt_response(self, data: Dict) -> List[Dict]:
         """Parse GDELT API response into standardized article format."""
         articles = []
         
-        if not data or 'articles' not in data:
+        if not data or not data.get('articles'):
             return articles
         
-        for article in data.get('articles', []):
-            try:
-                parsed = {
-                    'title': article.get('title', '').strip(),
-                    'url': article.get('url', ''),
-                    'date': article.get('seendate', '')[:10] if article.get('seendate') else '',
-                    'source': article.get('domain', ''),
-                    'snippet': article.get('title', '')[:200],
-                    'language': article.get('language', 'en')
-                }
-                if parsed['title'] and parsed['url']:
-                    articles.append(parsed)
-            except Exception:
+        append = articles.append
+        for article in data['articles']:
+            if not isinstance(article, dict):
+                continue
+            raw_title = article.get('title') or ''
+            title = raw_title.strip()
+            url = article.get('url')
+            if not title or not url:
                 continue
+            seendate = article.get('seendate')
+            append({
+                'title': title,
+                'url': url,
+                'date': seendate[:10] if seendate else '',
+                'source': article.get('domain', ''),
+                'snippet': raw_title[:200],
+                'language': article.get('language', 'en')
+            })
         
         return articles
     
@@ -135,7 +226,8 @@ class GDELTProvider:
         
         for article in articles:
             url = article.get('url', '')
-            title = article.get('title', '').lower()[:50]
+            # Whole title, ignoring case, punctuation and spacing differences.
+            title = _NON_WORD.sub('', article.get('title', '').casefold())
             
             if url in seen_urls or title in seen_titles:
                 continue
@@ -146,7 +238,7 @@ class GDELTProvider:
         
         return unique
     
-    def fetch_articles(self, city: str, country: str, keywords: List[str], 
+    def fetch_articles(self, city: str, country: str, keywords: Sequence[str], 
                        days: int = 30, max_records: int = 50,
                        city_aliases: Optional[List[str]] = None) -> Dict:
         """
@@ -163,6 +255,14 @@ class GDELTProvider:
         Returns:
             Dict with 'articles', 'success', 'error' fields
         """
+        if not keywords:
+            # A location-only query would pull in all news for the place.
+            return {
+                'articles': [],
+                'success': False,
+                'error': 'No keywords given for GDELT query'
+            }
+        
         try:
             query = self._build_query(city, country, keywords, days, city_aliases)
             
@@ -182,13 +282,18 @@ class GDELTProvider:
             params = {
                 'query': query,
                 'mode': 'artlist',
-                'maxrecords': str(max_records),
+                'maxrecords': str(min(max_records, MAX_RECORDS_LIMIT)),
                 'format': 'json',
                 'timespan': timespan,
                 'sort': 'DateDesc'
             }
             
-            response = self.session.get(self.BASE_URL, params=params, timeout=self.timeout)
+            cache_key = tuple(sorted(params.items()))
+            cached = _cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            response = _rate_limited_get(self.session, self.BASE_URL, params, self.timeout)
             
             if response.status_code != 200:
                 return {
@@ -197,16 +302,18 @@ class GDELTProvider:
                     'error': f'GDELT API returned status {response.status_code}'
                 }
             
-            response_text = response.text.strip()
-            if not response_text or response_text == '':
+            if not response.content.strip():
                 return {
                     'articles': [],
                     'success': True,
                     'error': None
                 }
             
+            # Parsed in one go: artlist bodies are capped by maxrecords (tens of
+            # KB), so streaming them through an incremental parser costs more
+            # CPU than the buffer it saves.
             try:
-                data = response.json()
+                data = orjson.loads(response.content) if orjson is not None else response.json()
             except ValueError:
                 return {
                     'articles': [],
@@ -217,11 +324,13 @@ class GDELTProvider:
             articles = self._parse_gdelt_response(data)
             articles = self._deduplicate_articles(articles)
             
-            return {
+            result = {
                 'articles': articles,
                 'success': True,
                 'error': None
             }
+            _cache.set(cache_key, result)
+            return result
             
         except requests.exceptions.Timeout:
             return {
@@ -245,20 +354,17 @@ class GDELTProvider:
     def get_homicide_articles(self, city: str, country: str, days: int = 30,
                               city_aliases: Optional[List[str]] = None) -> Dict:
         """Fetch articles related to homicides/violent crimes."""
-        keywords = self._get_all_keywords(self.HOMICIDE_KEYWORDS)
-        return self.fetch_articles(city, country, keywords, days, city_aliases=city_aliases)
+        return self.fetch_articles(city, country, self.ALL_HOMICIDE_KEYWORDS, days, city_aliases=city_aliases)
     
     def get_demonstration_articles(self, city: str, country: str, days: int = 14,
                                    city_aliases: Optional[List[str]] = None) -> Dict:
         """Fetch articles related to demonstrations/protests."""
-        keywords = self._get_all_keywords(self.DEMONSTRATION_KEYWORDS)
-        return self.fetch_articles(city, country, keywords, days, city_aliases=city_aliases)
+        return self.fetch_articles(city, country, self.ALL_DEMONSTRATION_KEYWORDS, days, city_aliases=city_aliases)
     
     def get_crime_articles(self, city: str, country: str, days: int = 30,
                           city_aliases: Optional[List[str]] = None) -> Dict:
         """Fetch articles related to general crime/security incidents."""
-        keywords = self._get_all_keywords(self.CRIME_KEYWORDS)
-        return self.fetch_articles(city, country, keywords, days, city_aliases=city_aliases)
+        return self.fetch_articles(city, country, self.ALL_CRIME_KEYWORDS, days, city_aliases=city_aliases)
     
     def get_all_security_articles(self, city: str, country: str, 
                                    homicide_days: int = 30,
@@ -267,14 +373,18 @@ class GDELTProvider:
         Fetch all security-relevant articles in one call.
         
         Returns categorized results for homicides, demonstrations, and general crime.
-        """
-        homicides = self.get_homicide_articles(city, country, homicide_days)
-        demonstrations = self.get_demonstration_articles(city, country, demo_days)
-        crime = self.get_crime_articles(city, country, homicide_days)
+        The three queries run one after another: the rate gate spaces GDELT
+        requests anyway, so a thread fan-out would only add threads waiting on it.
         
+        They are deliberately not merged into one OR-query: GDELT matches
+        keywords against full article text, so re-bucketing by title would
+        misfile most results; the windows differ (homicide vs demo days); a
+        shared maxrecords lets one category crowd out the others; and the
+        60+ term union approaches GDELT's query-length limit.
+        """
         return {
-            'homicides': homicides,
-            'demonstrations': demonstrations,
-            'crime': crime,
-            'fetched_at': datetime.now().isoformat()
+            'homicides': self.get_homicide_articles(city, country, homicide_days),
+            'demonstrations': self.get_demonstration_articles(city, country, demo_days),
+            'crime': self.get_crime_articles(city, country, homicide_days),
+            'fetched_at': datetime.now().isoformat(timespec='seconds')
         }
@@ -8,12 +8,52 @@ API Documentation: https://mediastack.com/documentation
 """
 
 import os
+import re
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
 from typing import List, Dict, Optional
-import logging
 
-logger = logging.getLogger(__name__)
+from .response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Free tier allows 100 requests/month; repeat queries within half an hour are
+# answered from memory.
+CACHE_TTL_SECONDS = 1800
+_cache = ResponseCache(CACHE_TTL_SECONDS)
+
+# Shared across providers (one is created per lookup) so queries reuse
+# keep-alive connections; transient 429/5xx answers are retried with backoff.
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'SecurityIntelligenceApp/1.0'
+})
+_adapter = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=['GET'], raise_on_status=False)
+)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+
+def _published_date(published_at: Optional[str]) -> str:
+    """Reduce a MediaStack published_at timestamp to YYYY-MM-DD ('' if unusable)."""
+    if not published_at or not isinstance(published_at, str):
+        return ''
+    if len(published_at) >= 10 and published_at[4] == '-' and published_at[7] == '-':
+        # ISO 8601 already starts with the (local) calendar date.
+        return published_at[:10]
+    try:
+        return datetime.fromisoformat(published_at.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        return published_at[:10] if len(published_at) >= 10 else ''
 
 
 class MediaStackProvider:
@@ -42,6 +82,8 @@ class MediaStackProvider:
         'riot', 'unrest', 'blockade', 'uprising'
     ]
     
+    # Plain dict lookup; the single lower()/strip() per call is negligible next
+    # to the HTTP request it precedes, so the map is not memoised or interned.
     COUNTRY_CODES = {
         'france': 'fr', 'germany': 'de', 'united kingdom': 'gb', 'uk': 'gb',
         'spain': 'es', 'italy': 'it', 'netherlands': 'nl', 'belgium': 'be',
@@ -63,10 +105,7 @@ class MediaStackProvider:
     def __init__(self, api_key: Optional[str] = None, timeout: int = 30):
         self.api_key = api_key or os.environ.get('MEDIASTACK_API_KEY')
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SecurityIntelligenceApp/1.0'
-        })
+        self.session = _session
     
     def is_configured(self) -> bool:
         """Check if MediaStack API key is configured."""
@@ -83,56 +122,43 @@ class MediaStackProvider:
         """Parse MediaStack API response into standardized article format."""
         articles = []
         
-        if not data or 'data' not in data:
+        if not data or not data.get('data'):
             return articles
         
-        for article in data.get('data', []):
-            try:
-                published_at = article.get('published_at', '')
-                if published_at:
-                    try:
-                        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        date_str = dt.strftime('%Y-%m-%d')
-                    except Exception:
-                        date_str = published_at[:10] if len(published_at) >= 10 else ''
-                else:
-                    date_str = ''
-                
-                parsed = {
-                    'title': (article.get('title') or '').strip(),
-                    'description': (article.get('description') or '').strip(),
-                    'url': article.get('url', ''),
-                    'date': date_str,
-                    'source': article.get('source', ''),
-                    'category': article.get('category', ''),
-                    'language': article.get('language', 'en'),
-                    'country': article.get('country', ''),
-                    'author': article.get('author', ''),
-                    'image': article.get('image', '')
-                }
-                
-                if parsed['title'] and parsed['url']:
-                    articles.append(parsed)
-            except Exception as e:
-                logger.debug(f"Error parsing MediaStack article: {e}")
+        append = articles.append
+        for article in data['data']:
+            if not isinstance(article, dict):
                 continue
+            title = (article.get('title') or '').strip()
+            url = article.get('url')
+            if not title or not url:
+                continue
+            append({
+                'title': title,
+                'description': (article.get('description') or '').strip(),
+                'url': url,
+                'date': _published_date(article.get('published_at')),
+                'source': article.get('source', ''),
+                'category': article.get('category', ''),
+                'language': article.get('language', 'en'),
+                'country': article.get('country', ''),
+                'author': article.get('author', ''),
+                'image': article.get('image', '')
+            })
         
         return articles
     
     def _filter_by_city(self, articles: List[Dict], city: str) -> List[Dict]:
-        """Filter articles that mention the city."""
+        """Filter articles that mention the city as a whole word."""
         if not city:
             return articles
         
-        city_lower = city.lower()
-        filtered = []
-        
-        for article in articles:
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
-            if city_lower in text:
-                filtered.append(article)
-        
-        return filtered
+        # Whole-word, case-insensitive: "Paris" should not match "Parish".
+        search = re.compile(rf'\b{re.escape(city)}\b', re.IGNORECASE).search
+        return [
+            article for article in articles
+            if search(article.get('title') or '') or search(article.get('description') or '')
+        ]
     
     def fetch_news(self, keywords: List[str], country: Optional[str] = None,
                    city: Optional[str] = None, limit: int = 50, 
@@ -169,13 +195,18 @@ class MediaStackProvider:
             keyword_phrase = f"{location} {keywords[0]}" if keywords else location
             
             params = {
-                'access_key': self.api_key,
                 'keywords': keyword_phrase,
                 'languages': languages,
                 'limit': min(limit, 100),
                 'sort': 'published_desc'
             }
             
+            cache_key = tuple(sorted(params.items()))
+            cached = _cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            params['access_key'] = self.api_key
             response = self.session.get(self.BASE_URL, params=params, timeout=self.timeout)
             
             if response.status_code == 401:
@@ -199,7 +230,7 @@ class MediaStackProvider:
                     'error': f'MediaStack API returned status {response.status_code}'
                 }
             
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             if 'error' in data:
                 error_info = data['error']
@@ -212,12 +243,14 @@ class MediaStackProvider:
             
             articles = self._parse_response(data)
             
-            return {
+            result = {
                 'articles': articles,
                 'success': True,
                 'error': None,
                 'pagination': data.get('pagination', {})
             }
+            _cache.set(cache_key, result)
+            return result
             
         except requests.exceptions.Timeout:
             return {
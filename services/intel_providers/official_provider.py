@@ -7,11 +7,14 @@ If scraping fails or sources are unavailable, it gracefully falls back.
 Note: Web scraping can be fragile. This provider is designed to fail gracefully
 and indicate when official sources are unavailable.
 
-Requires: requests, beautifulsoup4 (optional but recommended)
+Requires: requests, beautifulsoup4 (optional but recommended), lxml (optional,
+C parser used by BeautifulSoup when installed), selectolax (optional, fastest
+text extraction)
 """
 
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
@@ -21,6 +24,21 @@ try:
 except ImportError:
     BS4_AVAILABLE = False
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401 - only probed; BeautifulSoup loads the parser by name
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# libxml2 parses several times faster than the pure-Python html.parser.
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
 
 class OfficialProvider:
     """
@@ -51,6 +69,10 @@ class OfficialProvider:
         'en': [r'demonstration', r'protest', r'road closure', r'public gathering'],
         'de': [r'demonstration', r'kundgebung', r'sperrung', r'versammlung'],
     }
+    _DEMO_RE = re.compile(
+        '|'.join(f'(?:{p})' for patterns in DEMONSTRATION_PATTERNS.values() for p in patterns),
+        re.IGNORECASE
+    )
     
     def __init__(self, timeout: int = 15):
         self.timeout = timeout
@@ -69,9 +91,17 @@ class OfficialProvider:
         return country_map.get(country.upper(), country.upper()[:2])
     
     def _extract_text(self, html: str) -> str:
-        """Extract text from HTML, using BeautifulSoup if available."""
-        if self.bs4_available:
-            soup = BeautifulSoup(html, 'html.parser')
+        """Extract text from HTML: selectolax, then BeautifulSoup, then regexes."""
+        if SELECTOLAX_AVAILABLE:
+            # Lexbor walks the C tree directly; no Python object per node.
+            tree = LexborHTMLParser(html)
+            for node in tree.css('script, style'):
+                node.decompose()
+            # Whole document, like soup.get_text(): <title> text is kept too.
+            root = tree.root
+            return root.text(separator=' ', strip=True) if root is not None else ''
+        elif self.bs4_available:
+            soup = BeautifulSoup(html, HTML_PARSER)
             for script in soup(['script', 'style']):
                 script.decompose()
             return soup.get_text(separator=' ', strip=True)
@@ -186,7 +216,12 @@ class OfficialProvider:
         }
         
         if country_code == 'UK':
-            police_data = self._fetch_uk_police_data(city, lat, lon)
+            # Independent hosts; overlap the two round trips.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='official') as executor:
+                gov_future = executor.submit(self._search_gov_uk, city)
+                police_data = self._fetch_uk_police_data(city, lat, lon)
+                gov_data = gov_future.result()
+            
             result['sources_checked'].append('Police.uk')
             
             if police_data.get('success'):
@@ -197,7 +232,6 @@ class OfficialProvider:
                 })
                 result['success'] = True
             
-            gov_data = self._search_gov_uk(city)
             result['sources_checked'].append('GOV.UK')
             
             if gov_data.get('success'):
@@ -225,14 +259,9 @@ class OfficialProvider:
         
         demos = []
         for announcement in official.get('announcements', []):
-            title_lower = announcement.get('title', '').lower()
-            snippet_lower = announcement.get('snippet', '').lower()
-            
-            for lang, patterns in self.DEMONSTRATION_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, title_lower) or re.search(pattern, snippet_lower):
-                        demos.append(announcement)
-                        break
+            if (self._DEMO_RE.search(announcement.get('title', ''))
+                    or self._DEMO_RE.search(announcement.get('snippet', ''))):
+                demos.append(announcement)
         
         return {
             'demonstrations': demos,
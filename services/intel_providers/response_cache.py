@@ -0,0 +1,44 @@
+"""
+In-memory TTL cache for provider responses.
+
+Report generation, previews and draft autosaves repeat the same queries for a
+venue within minutes; the providers keep successful results here so those
+repeats skip the HTTP round trip (and, for MediaStack, the monthly quota).
+Process-local on purpose: the app runs as a single desktop/server process.
+"""
+
+import time
+import threading
+from typing import Dict, Hashable, Optional
+
+
+class ResponseCache:
+    """Thread-safe dict of result dicts with per-entry expiry."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Return a shallow copy of the cached result, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            return dict(entry[1])
+
+    def set(self, key: Hashable, result: Dict) -> None:
+        """Store result for ttl_seconds; the whole cache is dropped when full."""
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                self._entries.clear()
+            self._entries[key] = (time.time() + self.ttl_seconds, dict(result))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
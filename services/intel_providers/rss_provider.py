@@ -9,6 +9,9 @@ Requires: feedparser (pip install feedparser)
 """
 
 import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from email.utils import parsedate_to_datetime
@@ -19,6 +22,37 @@ try:
 except ImportError:
     FEEDPARSER_AVAILABLE = False
 
+# Feeds are downloaded here and handed to feedparser as bytes: its built-in
+# urllib fetch opens a fresh connection per feed and ignores self.timeout.
+_session = requests.Session()
+if FEEDPARSER_AVAILABLE:
+    _session.headers.update({'User-Agent': feedparser.USER_AGENT})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=4)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_tags(html: str, limit: int) -> str:
+    """
+    Same as _TAG_RE.sub('', html)[:limit], but stops scanning once limit
+    characters of text are collected (summaries can be multi-KB HTML).
+    """
+    parts = []
+    size = 0
+    pos = 0
+    for match in _TAG_RE.finditer(html):
+        text = html[pos:match.start()]
+        parts.append(text)
+        size += len(text)
+        pos = match.end()
+        if size >= limit:
+            break
+    else:
+        parts.append(html[pos:])
+    return ''.join(parts)[:limit]
+
 
 class RSSProvider:
     """
@@ -94,6 +128,11 @@ class RSSProvider:
         'crime': ['crime', 'robbery', 'assault', 'theft', 'vol', 'agression', 'cambriolage',
                  'raub', 'überfall', 'robo', 'asalto', 'rapina']
     }
+    # One alternation per category: a single scan finds any keyword.
+    _KEYWORD_RES = {
+        category: re.compile('|'.join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+        for category, keywords in SECURITY_KEYWORDS.items()
+    }
     
     def __init__(self, timeout: int = 20):
         self.timeout = timeout
@@ -147,43 +186,49 @@ class RSSProvider:
         
         return None
     
-    def _matches_location(self, text: str, city: str, country: str) -> bool:
-        """Check if text mentions the location."""
-        text_lower = text.lower()
-        
-        if city and city.lower() in text_lower:
-            return True
-        
-        return False
+    def _matches_location(self, text_lower: str, city_lower: str) -> bool:
+        """Check if already-lowercased text mentions the (lowercased) city."""
+        return city_lower in text_lower
     
     def _matches_keywords(self, text: str, category: str) -> bool:
         """Check if text matches keywords for a category."""
-        text_lower = text.lower()
-        keywords = self.SECURITY_KEYWORDS.get(category, [])
-        
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return True
-        
-        return False
+        pattern = self._KEYWORD_RES.get(category)
+        return pattern is not None and pattern.search(text) is not None
     
-    def _parse_feed(self, feed_info: Dict) -> List[Dict]:
-        """Parse a single RSS feed."""
+    def _parse_feed(self, feed_info: Dict, cutoff: Optional[datetime] = None) -> List[Dict]:
+        """
+        Parse a single RSS feed.
+        
+        Entries whose published_parsed tuple is already older than cutoff are
+        skipped before any date or summary work; fetch_articles still applies
+        the exact cutoff to whatever is returned.
+        """
+        cutoff_tuple = cutoff.timetuple()[:6] if cutoff else None
         try:
-            feed = feedparser.parse(feed_info['url'])
+            response = _session.get(feed_info['url'], timeout=self.timeout)
+            response.raise_for_status()
+            # feedparser reads lowercase header names (encoding, base URI for
+            # relative links).
+            headers = {k.lower(): v for k, v in response.headers.items()}
+            headers.setdefault('content-location', response.url)
+            feed = feedparser.parse(response.content, response_headers=headers)
             
             if feed.bozo and not feed.entries:
                 return []
             
             articles = []
             for entry in feed.entries[:50]:
+                published = entry.get('published_parsed')
+                if cutoff_tuple and published and tuple(published[:6]) < cutoff_tuple:
+                    continue
+                
                 title = entry.get('title', '').strip()
                 link = entry.get('link', '')
                 
                 summary = entry.get('summary', entry.get('description', ''))
                 if hasattr(summary, 'value'):
                     summary = summary.value
-                summary = re.sub(r'<[^>]+>', '', str(summary))[:300]
+                summary = _strip_tags(str(summary), 300)
                 
                 pub_date = self._parse_date(entry)
                 date_str = pub_date.strftime('%Y-%m-%d') if pub_date else ''
@@ -231,27 +276,28 @@ class RSSProvider:
             cutoff_date = datetime.now() - timedelta(days=days)
             all_articles = []
             
-            for feed_info in feeds:
-                articles = self._parse_feed(feed_info)
-                all_articles.extend(articles)
+            # Feeds live on different hosts; fetch them side by side so the
+            # lookup costs the slowest feed rather than the sum.
+            with ThreadPoolExecutor(max_workers=min(10, len(feeds)), thread_name_prefix='rss') as executor:
+                for articles in executor.map(lambda feed_info: self._parse_feed(feed_info, cutoff_date), feeds):
+                    all_articles.extend(articles)
             
+            city_lower = city.lower() if city else ''
             filtered = []
             for article in all_articles:
                 if article.get('pub_datetime') and article['pub_datetime'] < cutoff_date:
                     continue
                 
-                text = f"{article.get('title', '')} {article.get('snippet', '')}"
+                # Lowercased once; both checks below read the same copy.
+                text_lower = f"{article.get('title', '')} {article.get('snippet', '')}".lower()
                 
-                if city and not self._matches_location(text, city, country):
+                if city_lower and not self._matches_location(text_lower, city_lower):
                     continue
                 
-                if category != 'all' and not self._matches_keywords(text, category):
+                if category != 'all' and not self._matches_keywords(text_lower, category):
                     continue
                 
-                for a in article.copy():
-                    if a == 'pub_datetime':
-                        del article['pub_datetime']
-                
+                article.pop('pub_datetime', None)
                 filtered.append(article)
             
             filtered.sort(key=lambda x: x.get('date', ''), reverse=True)
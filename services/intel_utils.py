@@ -4,19 +4,38 @@ Utility functions for security intelligence formatting and calculations.
 
 import math
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 
+EARTH_RADIUS_KM = 6371.0088
+
+# Plain math on purpose: a report computes at most a few dozen distances, and a
+# JIT (numba) would add a large frozen-app dependency plus a compile on first
+# call that costs more than every distance the app will ever compute.
+
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two points using Haversine formula."""
-    R = 6371.0088
     phi1, phi2 = math.radians(lat1), math.radians(lat2)
     dphi = math.radians(lat2 - lat1)
     dlambda = math.radians(lon2 - lon1)
 
     a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    return EARTH_RADIUS_KM * c
+
+
+def _distance_from(lat1: float, lon1: float) -> Callable[[float, float], float]:
+    """haversine_km with the origin fixed; its radians and cosine are computed once."""
+    phi1 = math.radians(lat1)
+    cos_phi1 = math.cos(phi1)
+
+    def distance(lat2: float, lon2: float) -> float:
+        phi2 = math.radians(lat2)
+        dlambda = math.radians(lon2 - lon1)
+        a = math.sin((phi2 - phi1) / 2) ** 2 + cos_phi1 * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+        return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return distance
 
 
 def risk_level(distance_km: Optional[float]) -> str:
@@ -104,16 +123,15 @@ def get_confidence_score(source: str) -> float:
     return 0.6
 
 
-def enrich_incident(incident: Dict, user_lat: float, user_lon: float) -> Dict:
-    """Enrich an incident with distance, category, and confidence."""
+def _enrich(incident: Dict, distance: Optional[Callable[[float, float], float]]) -> Dict:
     enriched = incident.copy()
     
     inc_lat = incident.get('latitude')
     inc_lon = incident.get('longitude')
     
-    if inc_lat and inc_lon and user_lat and user_lon:
+    if inc_lat and inc_lon and distance is not None:
         try:
-            enriched['distance_km'] = haversine_km(user_lat, user_lon, float(inc_lat), float(inc_lon))
+            enriched['distance_km'] = distance(float(inc_lat), float(inc_lon))
         except (ValueError, TypeError):
             enriched['distance_km'] = None
     else:
@@ -129,3 +147,23 @@ def enrich_incident(incident: Dict, user_lat: float, user_lon: float) -> Dict:
     enriched['risk_level'] = risk_level(enriched.get('distance_km'))
     
     return enriched
+
+
+def _user_distance(user_lat: float, user_lon: float) -> Optional[Callable[[float, float], float]]:
+    if not (user_lat and user_lon):
+        return None
+    try:
+        return _distance_from(float(user_lat), float(user_lon))
+    except (ValueError, TypeError):
+        return None
+
+
+def enrich_incident(incident: Dict, user_lat: float, user_lon: float) -> Dict:
+    """Enrich an incident with distance, category, and confidence."""
+    return _enrich(incident, _user_distance(user_lat, user_lon))
+
+
+def enrich_incidents(incidents: List[Dict], user_lat: float, user_lon: float) -> List[Dict]:
+    """enrich_incident over a list; the user's side of the distance is computed once."""
+    distance = _user_distance(user_lat, user_lon)
+    return [_enrich(incident, distance) for incident in incidents]
@@ -0,0 +1,70 @@
+"""
+Fast JSON Provider
+
+Backs Flask's request.get_json() / jsonify() with orjson when it is installed,
+falling back to the stdlib provider otherwise. request.get_json() resolves to
+app.json.loads, so every JSON endpoint (security brief, AI assist, watchdog
+client logs, ...) decodes through orjson without per-route changes. Output matches the default
+provider: same key ordering and the same handling of dates, dataclasses,
+decimals and UUIDs (delegated to DefaultJSONProvider.default).
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson on the hot paths."""
+
+    def dumps(self, obj, **kwargs):
+        # Pretty-printing and other stdlib-only arguments (debug responses,
+        # explicit json.dumps calls) keep the stdlib behaviour.
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        option = _ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(obj)
+
+    def response(self, *args, **kwargs):
+        """
+        jsonify() entry point. The base class passes compact separators to
+        dumps() and then re-encodes the str; build the bytes body directly.
+        """
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        option = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def init_json_provider(app):
+    """Install OrjsonProvider on app if orjson is available."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    return app
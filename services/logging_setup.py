@@ -0,0 +1,59 @@
+"""
+Queued Logging
+
+Moves the root logger's handlers behind a QueueHandler so request threads
+only enqueue records; formatting (including tracebacks) and stream/file I/O
+happen on a single background QueueListener thread.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the record (traceback included) on the
+    calling thread so it can be pickled; an in-process queue does not need
+    that, so only the message arguments are merged here.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def init_queued_logging() -> Optional[QueueListener]:
+    """
+    Route the root logger through a queue. Safe to call more than once.
+
+    Returns:
+        The running QueueListener, or None if the root logger has no handlers.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return None
+
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
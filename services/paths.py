@@ -28,6 +28,12 @@ def is_frozen() -> bool:
     return getattr(sys, 'frozen', False)
 
 
+# Resolved once at import; neither location changes for the life of the process.
+_RUNTIME_ROOT = Path(sys.executable).parent if is_frozen() else Path(__file__).parent.parent
+_BUNDLE_DIR = (Path(sys._MEIPASS) if is_frozen() and hasattr(sys, '_MEIPASS')
+               else Path(__file__).parent.parent)
+
+
 def get_runtime_root() -> Path:
     """
     Get the runtime root directory.
@@ -35,9 +41,7 @@ def get_runtime_root() -> Path:
     For frozen builds: directory containing the executable
     For development: project root directory
     """
-    if is_frozen():
-        return Path(sys.executable).parent
-    return Path(__file__).parent.parent
+    return _RUNTIME_ROOT
 
 
 def get_bundle_dir() -> Path:
@@ -47,9 +51,7 @@ def get_bundle_dir() -> Path:
     For frozen builds: sys._MEIPASS (temp extraction directory)
     For development: project root directory
     """
-    if is_frozen() and hasattr(sys, '_MEIPASS'):
-        return Path(sys._MEIPASS)
-    return Path(__file__).parent.parent
+    return _BUNDLE_DIR
 
 
 def get_data_dir() -> Path:
@@ -164,13 +166,18 @@ def ensure_dirs_exist() -> None:
 
 
 def get_history_file() -> Path:
-    """Get the path to the history JSON file."""
-    return get_data_dir() / 'history_reports.json'
+    """Get the path to the history file (JSON Lines, one report per line)."""
+    return get_data_dir() / 'history_reports.ndjson'
 
 
 def get_history_backup_file() -> Path:
     """Get the path to the history backup file."""
-    return get_data_dir() / 'history_reports.backup.json'
+    return get_data_dir() / 'history_reports.backup.ndjson'
+
+
+def get_legacy_history_file() -> Path:
+    """Get the path to the pre-NDJSON history file (a single JSON array)."""
+    return get_data_dir() / 'history_reports.json'
 
 
 def get_questionnaire_file() -> Path:
@@ -191,3 +198,8 @@ def get_security_brief_cache_db() -> Path:
 def get_runtime_log_file() -> Path:
     """Get the path to the runtime log file."""
     return get_logs_dir() / 'runtime_report.log'
+
+
+def get_session_db() -> Path:
+    """Get the path to the server-side session database."""
+    return get_data_dir() / 'sessions.db'
@@ -117,9 +117,16 @@ class SecurityBriefService:
         
         return result
     
-    def invalidate_cache(self, city: str, country: str, address: Optional[str] = None):
+    def invalidate_cache(
+        self,
+        city: str,
+        country: str,
+        address: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ):
         """Force refresh by invalidating cache."""
-        self.cache.invalidate(city, country, address)
+        self.cache.invalidate(city, country, address, start_date, end_date)
 
 
 _service_instance = None
@@ -1,10 +1,13 @@
 """
 Caching service for City Security Brief
-Uses SQLite for persistent caching with TTL support.
+Uses SQLite for persistent caching with TTL support, fronted by a small
+in-process tier so repeat hits skip the database entirely.
 """
 import sqlite3
 import json
+import time
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import logging
@@ -16,6 +19,12 @@ logger = logging.getLogger(__name__)
 CACHE_DB_PATH = str(get_security_brief_cache_db())
 DEFAULT_TTL_HOURS = 6
 
+# The SQLite file is shared by every worker process; the memory tier is per
+# process, so it is capped well below the SQLite TTL to bound how long another
+# worker can serve an entry that was refreshed elsewhere.
+MEMORY_TTL_SECONDS = 300
+MEMORY_MAX_ENTRIES = 256
+
 
 class SecurityCache:
     """SQLite-based cache for security brief data."""
@@ -23,8 +32,31 @@ class SecurityCache:
     def __init__(self, db_path: str = CACHE_DB_PATH, ttl_hours: int = DEFAULT_TTL_HOURS):
         self.db_path = db_path
         self.ttl_hours = ttl_hours
+        self._memory: Dict[str, tuple] = {}
+        self._memory_lock = threading.Lock()
         self._init_db()
     
+    def _memory_get(self, cache_key: str) -> Optional[str]:
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._memory[cache_key]
+                return None
+            return entry[1]
+    
+    def _memory_set(self, cache_key: str, payload: str, expires_at: float):
+        expires_at = min(expires_at, time.time() + MEMORY_TTL_SECONDS)
+        with self._memory_lock:
+            if len(self._memory) >= MEMORY_MAX_ENTRIES and cache_key not in self._memory:
+                self._memory.clear()
+            self._memory[cache_key] = (expires_at, payload)
+    
+    def _memory_delete(self, cache_key: str):
+        with self._memory_lock:
+            self._memory.pop(cache_key, None)
+    
     def _init_db(self):
         """Initialize the cache database."""
         get_cache_dir().mkdir(parents=True, exist_ok=True)
@@ -45,6 +77,9 @@ class SecurityCache:
             CREATE INDEX IF NOT EXISTS idx_expires_at ON security_cache(expires_at)
         ''')
         
+        # WAL lets workers read the cache while another one writes to it.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         conn.commit()
         conn.close()
     
@@ -64,6 +99,11 @@ class SecurityCache:
         """Get cached data if available and not expired."""
         cache_key = self._generate_key(city, country, address, start_date, end_date)
         
+        payload = self._memory_get(cache_key)
+        if payload is not None:
+            logger.info(f"Cache hit (memory) for {city}, {country}")
+            return json.loads(payload)
+        
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -78,6 +118,7 @@ class SecurityCache:
             
             if row:
                 logger.info(f"Cache hit for {city}, {country}")
+                self._memory_set(cache_key, row[0], datetime.fromisoformat(row[1]).timestamp())
                 return json.loads(row[0])
             
             logger.info(f"Cache miss for {city}, {country}")
@@ -93,13 +134,16 @@ class SecurityCache:
         expires_at = datetime.now() + timedelta(hours=self.ttl_hours)
         
         try:
+            payload = json.dumps(data)
+            self._memory_set(cache_key, payload, expires_at.timestamp())
+            
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute('''
                 INSERT OR REPLACE INTO security_cache (cache_key, data, created_at, expires_at)
                 VALUES (?, ?, ?, ?)
-            ''', (cache_key, json.dumps(data), datetime.now().isoformat(), expires_at.isoformat()))
+            ''', (cache_key, payload, datetime.now().isoformat(), expires_at.isoformat()))
             
             conn.commit()
             conn.close()
@@ -129,9 +173,10 @@ class SecurityCache:
         except Exception as e:
             logger.error(f"Cache clear error: {e}")
     
-    def invalidate(self, city: str, country: str, address: Optional[str] = None):
+    def invalidate(self, city: str, country: str, address: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None):
         """Invalidate a specific cache entry."""
-        cache_key = self._generate_key(city, country, address)
+        cache_key = self._generate_key(city, country, address, start_date, end_date)
+        self._memory_delete(cache_key)
         
         try:
             conn = sqlite3.connect(self.db_path)
@@ -21,6 +21,7 @@ All data is sourced and no numbers are invented.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -29,10 +30,17 @@ from .intel_providers import (
     MediaStackProvider, is_mediastack_available
 )
 from .security_intel_cache import SecurityIntelCache
-from .intel_utils import enrich_incident, sort_events, get_confidence_score
+from .intel_utils import enrich_incidents, sort_events, get_confidence_score
 
 logger = logging.getLogger(__name__)
 
+# Geocoding, incident and demonstration lookups hit independent upstreams;
+# running them side by side makes a request cost max(latencies), not the sum.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='intel-fetch')
+# Leaf fetches issued from inside _FETCH_POOL tasks; a separate pool so those
+# tasks never wait on work queued behind themselves.
+_FALLBACK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='intel-fallback')
+
 CITY_COUNTRY_MAPPINGS = {
     'mexico': {
         'city': 'Mexico City',
@@ -234,6 +242,49 @@ def get_violent_incidents(city: str, country: str, days: int = 30,
     return result
 
 
+def _fetch_gdelt_and_rss(gdelt_fetch, rss_fetch) -> List[Dict]:
+    """
+    Run the GDELT and RSS fallbacks side by side (GDELT on this thread).
+
+    Returns GDELT articles followed by RSS articles; RSS failures are ignored.
+    """
+    rss_future = _FALLBACK_POOL.submit(rss_fetch)
+    articles = []
+    
+    gdelt_result = gdelt_fetch()
+    if gdelt_result.get('success'):
+        articles.extend(gdelt_result.get('articles', []))
+    
+    try:
+        rss_result = rss_future.result()
+        if rss_result.get('success'):
+            articles.extend(rss_result.get('articles', []))
+    except Exception:
+        pass
+    
+    return articles
+
+
+def _unique_by_url(articles: List[Dict]) -> List[Dict]:
+    """Drop articles whose URL was already seen across providers (first wins)."""
+    unique = {}
+    for article in articles:
+        unique.setdefault(article.get('url', ''), article)
+    return list(unique.values())
+
+
+def _news_scope(articles: List[Dict], city: str) -> str:
+    """'City' when more than 30% of articles mention the city, else country-level."""
+    city_lower = city.lower()
+    city_matches = sum(
+        1 for a in articles
+        if city_lower in f"{a.get('title', '')} {a.get('description', '')}".lower()
+    )
+    if city_matches > len(articles) * 0.3:
+        return 'City'
+    return 'Country (news-based)'
+
+
 def _get_incidents_from_fallback(city: str, country: str, days: int,
                                   city_aliases: List[str] = None) -> Dict:
     """
@@ -256,29 +307,14 @@ def _get_incidents_from_fallback(city: str, country: str, days: int,
             logger.warning(f"MediaStack failed: {e}")
     
     if not all_articles:
-        gdelt = GDELTProvider()
-        gdelt_result = gdelt.get_homicide_articles(city, country, days, city_aliases=city_aliases)
-        
-        if gdelt_result.get('success'):
-            all_articles.extend(gdelt_result.get('articles', []))
-        
-        try:
-            rss = RSSProvider()
-            rss_result = rss.get_homicide_articles(city, country, days)
-            if rss_result.get('success'):
-                all_articles.extend(rss_result.get('articles', []))
-        except Exception:
-            pass
+        all_articles.extend(_fetch_gdelt_and_rss(
+            lambda: GDELTProvider().get_homicide_articles(city, country, days, city_aliases=city_aliases),
+            lambda: RSSProvider().get_homicide_articles(city, country, days)
+        ))
         
         source_name = 'GDELT+RSS'
     
-    seen_urls = set()
-    unique_articles = []
-    for article in all_articles:
-        url = article.get('url', '')
-        if url not in seen_urls:
-            seen_urls.add(url)
-            unique_articles.append(article)
+    unique_articles = _unique_by_url(all_articles)
     
     incidents = []
     for article in unique_articles[:15]:
@@ -293,11 +329,7 @@ def _get_incidents_from_fallback(city: str, country: str, days: int,
             'url': article.get('url', '')
         })
     
-    city_matches = sum(1 for a in unique_articles if city.lower() in f"{a.get('title', '')} {a.get('description', '')}".lower())
-    if city_matches > len(unique_articles) * 0.3:
-        scope = 'City'
-    else:
-        scope = 'Country (news-based)'
+    scope = _news_scope(unique_articles, city)
     
     return {
         'success': True,
@@ -399,29 +431,14 @@ def _get_demos_from_fallback(city: str, country: str, days: int,
             logger.warning(f"MediaStack failed for demos: {e}")
     
     if not all_articles:
-        gdelt = GDELTProvider()
-        gdelt_result = gdelt.get_demonstration_articles(city, country, days, city_aliases=city_aliases)
-        
-        if gdelt_result.get('success'):
-            all_articles.extend(gdelt_result.get('articles', []))
-        
-        try:
-            rss = RSSProvider()
-            rss_result = rss.get_demonstration_articles(city, country, days)
-            if rss_result.get('success'):
-                all_articles.extend(rss_result.get('articles', []))
-        except Exception:
-            pass
+        all_articles.extend(_fetch_gdelt_and_rss(
+            lambda: GDELTProvider().get_demonstration_articles(city, country, days, city_aliases=city_aliases),
+            lambda: RSSProvider().get_demonstration_articles(city, country, days)
+        ))
         
         source_name = 'GDELT+RSS'
     
-    seen_urls = set()
-    unique_articles = []
-    for article in all_articles:
-        url = article.get('url', '')
-        if url not in seen_urls:
-            seen_urls.add(url)
-            unique_articles.append(article)
+    unique_articles = _unique_by_url(all_articles)
     
     demonstrations = []
     for article in unique_articles[:10]:
@@ -436,11 +453,7 @@ def _get_demos_from_fallback(city: str, country: str, days: int,
             'url': article.get('url', '')
         })
     
-    city_matches = sum(1 for a in unique_articles if city.lower() in f"{a.get('title', '')} {a.get('description', '')}".lower())
-    if city_matches > len(unique_articles) * 0.3:
-        scope = 'City'
-    else:
-        scope = 'Country (news-based)'
+    scope = _news_scope(unique_articles, city)
     
     return {
         'success': True,
@@ -764,15 +777,26 @@ def get_full_security_intel(city: str, country: str,
     """
     country = convert_iso2_to_country(country)
     
-    user_lat, user_lon = _geocode_city(city, country)
-    
-    incidents = get_violent_incidents(city, country, incident_days, use_cache, offline_mode)
-    demonstrations = get_demonstrations(city, country, demo_days, use_cache, offline_mode)
-    risk_assessment = build_risk_assessment(incidents, demonstrations)
+    geocode_future = _FETCH_POOL.submit(_geocode_city, city, country)
+    incidents_future = _FETCH_POOL.submit(
+        get_violent_incidents, city, country, incident_days, use_cache, offline_mode
+    )
+    demos_future = _FETCH_POOL.submit(
+        get_demonstrations, city, country, demo_days, use_cache, offline_mode
+    )
     
+    incidents = incidents_future.result()
     scope_used = incidents.get('scope', 'Unknown')
     source_used = incidents.get('source', 'Unknown')
     
+    # News context only depends on the incident source, so start it while
+    # demonstrations and geocoding may still be in flight.
+    news_future = _FETCH_POOL.submit(_get_news_context, city, country, source_used)
+    
+    demonstrations = demos_future.result()
+    user_lat, user_lon = geocode_future.result()
+    risk_assessment = build_risk_assessment(incidents, demonstrations)
+    
     if source_used == 'ACLED':
         overall_confidence = "High"
     elif incidents.get('success') and demonstrations.get('success'):
@@ -784,7 +808,9 @@ def get_full_security_intel(city: str, country: str,
     raw_incidents = incidents.get('incidents', [])[:10]
     for inc in raw_incidents:
         inc['source'] = inc.get('source') or source_used
-        enriched = enrich_incident(inc, user_lat, user_lon) if user_lat and user_lon else inc
+    if user_lat and user_lon:
+        raw_incidents = enrich_incidents(raw_incidents, user_lat, user_lon)
+    for enriched in raw_incidents:
         incident_items.append({
             'date': enriched.get('date', ''),
             'datetime': enriched.get('date', ''),
@@ -809,9 +835,11 @@ def get_full_security_intel(city: str, country: str,
     demo_source = demonstrations.get('source', 'Unknown')
     for demo in raw_demos:
         demo['source'] = demo.get('source') or demo_source
-        enriched = enrich_incident(demo, user_lat, user_lon) if user_lat and user_lon else demo
+    if user_lat and user_lon:
+        raw_demos = enrich_incidents(raw_demos, user_lat, user_lon)
+    for enriched in raw_demos:
         cat = 'PROTEST'
-        if demo.get('event_type', '').lower().find('riot') >= 0:
+        if enriched.get('event_type', '').lower().find('riot') >= 0:
             cat = 'RIOT'
         demo_items.append({
             'date': enriched.get('date', ''),
@@ -862,7 +890,7 @@ def get_full_security_intel(city: str, country: str,
     if is_news_based:
         disclaimer_text = 'Data is aggregated from news sources and may not reflect official statistics. Events are filtered by keyword matching and may include false positives.'
     
-    news_context_items = _get_news_context(city, country, source_used)
+    news_context_items = news_future.result()
     planned_demos = _detect_planned_demonstrations(news_context_items)
     
     return {
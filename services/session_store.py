@@ -0,0 +1,185 @@
+"""
+Server-side session storage for Flask.
+
+Keeps session payloads (mostly the report form) in a local SQLite database
+so the browser cookie only carries a signed session id. Without this, the
+whole form is re-serialized, signed and sent back in Set-Cookie on every
+response, and large forms can overflow the 4 KB cookie limit.
+
+No external dependencies beyond Flask and the standard library.
+"""
+import sqlite3
+import hashlib
+import secrets
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from flask.sessions import SessionInterface, SessionMixin, session_json_serializer
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+from services.paths import get_session_db, get_data_dir
+
+logger = logging.getLogger(__name__)
+
+SESSION_DB_PATH = str(get_session_db())
+DEFAULT_TTL_DAYS = 31
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its id and whether it was modified."""
+    
+    def __init__(self, initial=None, sid: Optional[str] = None, new: bool = False,
+                 digest: Optional[bytes] = None):
+        def on_update(self):
+            self.modified = True
+        
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.digest = digest
+
+
+def _digest(payload: str) -> bytes:
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+
+class SQLiteSessionInterface(SessionInterface):
+    """Flask session interface storing session data in SQLite."""
+    
+    serializer = session_json_serializer
+    session_class = ServerSideSession
+    
+    def __init__(self, db_path: str = SESSION_DB_PATH, ttl_days: int = DEFAULT_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl_days = ttl_days
+        self._init_db()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+    
+    def _init_db(self):
+        """Initialize the session database."""
+        get_data_dir().mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS sessions (
+                    sid TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    expires_at TIMESTAMP NOT NULL
+                )
+            ''')
+            conn.execute('DELETE FROM sessions WHERE expires_at < ?', (datetime.now().isoformat(),))
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def _signer(self, app) -> Optional[Signer]:
+        if not app.secret_key:
+            return None
+        return Signer(app.secret_key, salt='server-side-session')
+    
+    def _load(self, sid: str) -> Optional[str]:
+        """Return the raw serialized payload for sid, if it has not expired."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT data FROM sessions WHERE sid = ? AND expires_at > ?',
+                (sid, datetime.now().isoformat())
+            ).fetchone()
+        finally:
+            conn.close()
+        
+        return row[0] if row else None
+    
+    def _store(self, sid: str, payload: str):
+        expires_at = datetime.now() + timedelta(days=self.ttl_days)
+        conn = self._connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO sessions (sid, data, expires_at) VALUES (?, ?, ?)',
+                (sid, payload, expires_at.isoformat())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def _delete(self, sid: str):
+        conn = self._connect()
+        try:
+            conn.execute('DELETE FROM sessions WHERE sid = ?', (sid,))
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def open_session(self, app, request):
+        signer = self._signer(app)
+        if signer is None:
+            return None
+        
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = signer.unsign(cookie).decode('utf-8')
+            except BadSignature:
+                sid = None
+            
+            if sid:
+                try:
+                    payload = self._load(sid)
+                    data = self.serializer.loads(payload) if payload is not None else None
+                except Exception as e:
+                    logger.error(f"Session load error: {e}")
+                    data = None
+                if data is not None:
+                    return self.session_class(data, sid=sid, digest=_digest(payload))
+        
+        return self.session_class(sid=secrets.token_urlsafe(32), new=True)
+    
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        
+        if not session:
+            if session.modified:
+                try:
+                    self._delete(session.sid)
+                except Exception as e:
+                    logger.error(f"Session delete error: {e}")
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+        
+        if session.modified or session.new:
+            # Routes often reassign identical data; only hit the database
+            # (and re-send the cookie) when the payload really changed.
+            payload = self.serializer.dumps(dict(session))
+            digest = _digest(payload)
+            if digest == session.digest:
+                session.modified = False
+            else:
+                try:
+                    self._store(session.sid, payload)
+                except Exception as e:
+                    logger.error(f"Session save error: {e}")
+                    return
+                session.digest = digest
+        
+        if not self.should_set_cookie(app, session) and not session.new:
+            return
+        
+        response.vary.add('Cookie')
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode('utf-8'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
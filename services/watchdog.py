@@ -18,7 +18,7 @@ import threading
 import traceback
 import functools
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 import logging
 from logging.handlers import RotatingFileHandler
 
@@ -124,23 +124,48 @@ class WatchdogLogger:
             context=f'THREAD_EXCEPTION (thread: {args.thread.name if args.thread else "unknown"})'
         )
     
-    def log_event(self, event_type: str, message: str, level: str = 'INFO', 
-                  extra_data: Optional[Dict] = None):
-        """Log a general event."""
-        log_entry = {
-            'event_type': event_type,
-            'message': message
-        }
-        if extra_data:
-            log_entry['extra'] = extra_data
-        
+    @staticmethod
+    def _format_event(event_type: str, message: str,
+                      extra_data: Optional[Dict] = None) -> str:
+        """Build the log line for a general event."""
         log_message = f"[{event_type}] {message}"
         if extra_data:
             log_message += f" | Data: {json.dumps(extra_data, default=str)}"
-        
+        return log_message
+    
+    def log_event(self, event_type: str, message: str, level: str = 'INFO', 
+                  extra_data: Optional[Dict] = None):
+        """Log a general event."""
+        log_message = self._format_event(event_type, message, extra_data)
         log_level = getattr(logging, level.upper(), logging.INFO)
         self.logger.log(log_level, log_message)
     
+    def log_events_bulk(self, events: Iterable[Tuple[str, str, str, Optional[Dict]]]):
+        """
+        Log a batch of events in one pass.
+        
+        Each event is an (event_type, message, level, extra_data) tuple, as
+        accepted by log_event. The caller is located once for the whole batch;
+        each record then goes through Logger.handle, so logger filters,
+        propagation and logging.lastResort behave exactly as for log_event.
+        """
+        if self.logger.disabled:
+            return
+        
+        caller = None
+        for event_type, message, level, extra_data in events:
+            log_level = getattr(logging, level.upper(), logging.INFO)
+            if not self.logger.isEnabledFor(log_level):
+                continue
+            if caller is None:
+                caller = self.logger.findCaller()
+            fn, lno, func, _ = caller
+            self.logger.handle(self.logger.makeRecord(
+                self.logger.name, log_level, fn, lno,
+                self._format_event(event_type, message, extra_data), None, None,
+                func=func
+            ))
+    
     def log_exception(self, exc_type: str, exc_value: str, 
                       exc_traceback: list, context: str = 'EXCEPTION',
                       extra_data: Optional[Dict] = None):
@@ -257,9 +282,11 @@ class WatchdogLogger:
             extra
         )
     
-    def log_user_action(self, action_type: str, action_details: str,
-                        user_id: str = None, extra_data: Optional[Dict] = None):
-        """Log a user action from the frontend."""
+    @staticmethod
+    def user_action_event(action_type: str, action_details: str,
+                          user_id: str = None,
+                          extra_data: Optional[Dict] = None) -> Tuple[str, str, str, Dict]:
+        """Build the event tuple logged for a user action (see log_events_bulk)."""
         action_data = {
             'action_type': action_type,
             'details': action_details
@@ -269,7 +296,12 @@ class WatchdogLogger:
         if extra_data:
             action_data.update(extra_data)
         
-        self.log_event('USER_ACTION', f"{action_type}: {action_details}", 'INFO', action_data)
+        return ('USER_ACTION', f"{action_type}: {action_details}", 'INFO', action_data)
+    
+    def log_user_action(self, action_type: str, action_details: str,
+                        user_id: str = None, extra_data: Optional[Dict] = None):
+        """Log a user action from the frontend."""
+        self.log_event(*self.user_action_event(action_type, action_details, user_id, extra_data))
     
     def log_data_anomaly(self, field_name: str, issue: str,
                          expected_type: str = None, actual_value: Any = None):